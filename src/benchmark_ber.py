@@ -1,3 +1,6 @@
+import sys
+from functools import partial
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -6,8 +9,319 @@ import encoder as encoder
 import modulator as modulator
 import utils as utils
 import noise as noise
+import pipeline as pipeline
+import planner as planner
+import theory as theory
+
+from utils import CodeID, EncoderID, ModulatorID, NoiseID
+
+
+DEFAULT_COMBINATIONS = [
+    (EncoderID.MANCHESTER, ModulatorID.BPSK),
+    (EncoderID.MANCHESTER, ModulatorID.QPSK),
+    (EncoderID.MANCHESTER, ModulatorID.QAM16),
+    (EncoderID.MANCHESTER, ModulatorID.QAM64),
+    (EncoderID.AMI_BIPOLAR, ModulatorID.BPSK),
+    (EncoderID.AMI_BIPOLAR, ModulatorID.QPSK),
+    (EncoderID.AMI_BIPOLAR, ModulatorID.QAM16),
+    (EncoderID.AMI_BIPOLAR, ModulatorID.QAM64),
+]
+
+
+def combination_label(enc, mod) -> str:
+    """Rótulo "Encoder + Modulador" usado nas legendas e nos resultados."""
+    encoder_name = enc.__class__.__name__.replace("Encoder", "")
+    modulator_name = mod.__class__.__name__.replace("Modulator", "")
+    return f"{encoder_name} + {modulator_name}"
+
+
+def transmit_waveform(tx_symbols: np.ndarray, pulse_shaper=None, ofdm=None) -> dict:
+    """Parte determinística do transmissor: símbolos -> [OFDM] -> [formatação de pulso].
+
+    Retorna um dict com a forma de onda (`wave`) e os tamanhos necessários no receptor.
+    """
+    tx_samples = ofdm.modulate(tx_symbols) if ofdm is not None else tx_symbols
+    tx_wave = pulse_shaper.shape(tx_samples) if pulse_shaper is not None else tx_samples
+    return {
+        "wave": tx_wave,
+        "num_samples": len(tx_samples),
+        "num_symbols": len(tx_symbols),
+        "real": np.isrealobj(tx_symbols),
+    }
+
+
+def receive_symbols(tx: dict, channel, snr_db: float, pulse_shaper=None,
+                    ofdm=None) -> tuple[np.ndarray, np.ndarray]:
+    """Canal e receptor: canal -> equalização -> [filtro casado] -> [OFDM^-1] -> símbolos.
+
+    - tx: saída de `transmit_waveform`.
+
+    Retorna: (símbolos equalizados, N0 de cada símbolo após a equalização), este
+    último usado para ponderar as LLRs pela CSI (N0/|h|^2 por quadro ou subportadora).
+    """
+    # Equalização com CSI perfeita logo após o canal (identidade no AWGN); em OFDM
+    # sem formatação de pulso, a resposta do canal vai para o equalizador por subportadora
+    channel_response = None
+    if pulse_shaper is not None:
+        rx_wave = channel.equalizar(channel.aplicar(tx["wave"], pulse_shaper.channel_snr_db(snr_db)))
+        rx_samples = pulse_shaper.matched_filter(rx_wave, tx["num_samples"])
+        # N0 no instante de amostragem de cada símbolo (centro do pulso transmitido)
+        center = np.arange(tx["num_samples"]) * pulse_shaper.sps + (len(pulse_shaper.taps) - 1) // 2
+        sample_var = channel.variancia_ruido(len(rx_wave))[center]
+    elif ofdm is not None:
+        rx_samples = channel.aplicar(tx["wave"], snr_db)
+        channel_response = channel.resposta_frequencia(ofdm.n_fft)
+        sample_var = np.full(len(rx_samples), channel.noise_power)
+    else:
+        rx_samples = channel.equalizar(channel.aplicar(tx["wave"], snr_db))
+        sample_var = channel.variancia_ruido(len(rx_samples))
+
+    if ofdm is not None:
+        rx_symbols, h_data = ofdm.demodulate(rx_samples, tx["num_symbols"], channel_response,
+                                             return_channel=True)
+        # A FFT (ortho) distribui o ruído do símbolo OFDM igualmente pelas subportadoras
+        n_ofdm = ofdm.num_ofdm_symbols(tx["num_symbols"])
+        frames = sample_var[:n_ofdm * ofdm.symbol_length].reshape(n_ofdm, ofdm.symbol_length)
+        per_ofdm = np.mean(frames[:, ofdm.cp_len:], axis=1)
+        noise_var = np.repeat(per_ofdm, len(ofdm.data_indices))[:tx["num_symbols"]] / np.abs(h_data) ** 2
+    else:
+        rx_symbols = rx_samples
+        noise_var = sample_var
+    if tx["real"]:
+        # Constelação real (BPSK) transmitida em banda base complexa; a componente
+        # em fase tem ruído N0/2, o mesmo da portadora única
+        rx_symbols = np.real(rx_symbols)
+    return rx_symbols, noise_var
+
+
+def transmit_symbols(tx_symbols: np.ndarray, channel, snr_db: float,
+                     pulse_shaper=None, ofdm=None) -> tuple[np.ndarray, np.ndarray]:
+    """Leva os símbolos do modulador até a entrada do demodulador.
+
+    símbolos -> [OFDM] -> [formatação de pulso] -> canal -> equalização
+    -> [filtro casado] -> [OFDM^-1 + equalização por subportadora] -> símbolos.
+
+    - pulse_shaper: opcional (ex.: `pulse_shaping.RRCPulseShaper`). Se None, o canal
+      recebe uma amostra por símbolo.
+    - ofdm: opcional (ex.: `ofdm.OFDMModem`). Se None, transmissão em portadora única.
+
+    Retorna: (símbolos, N0 por símbolo), como em `receive_symbols`.
+    """
+    tx = transmit_waveform(tx_symbols, pulse_shaper, ofdm)
+    return receive_symbols(tx, channel, snr_db, pulse_shaper, ofdm)
+
+
+def _count_uncoded_errors(rx_symbols: np.ndarray, mod, reference: np.ndarray) -> tuple[float, int, int]:
+    return utils.compute_ber(reference, mod.demodulate(rx_symbols))
+
+
+def _count_coded_errors(rx_symbols: np.ndarray, noise_var: np.ndarray, mod, enc, code,
+                        data_bits: np.ndarray) -> tuple[float, int, int]:
+    encoder_name = enc.__class__.__name__.replace("Encoder", "")
+    coded_length = -(-len(data_bits) // code.k) * code.n
+    line_llr = modulator.soft_demodulate(mod, rx_symbols, noise_var)
+    llr = utils.line_llrs_to_bit_llrs(line_llr, encoder_name, original_length=coded_length)
+    rx_bits = code.decode(llr, original_length=len(data_bits))
+    return utils.compute_ber(data_bits, rx_bits)
+
+
+def simulate_ber_point(encoded_signal: np.ndarray, mod, channel, snr_db: float,
+                       pulse_shaper=None, ofdm=None) -> tuple[float, int, int]:
+    """Executa a cadeia a partir do sinal já codificado para um único ponto de SNR.
+
+    sinal codificado -> modulador -> `transmit_symbols` -> demodulador -> BER.
+
+    Retorna: (ber, errors, compared), como em `utils.compute_ber`.
+    """
+    modulator_name = mod.__class__.__name__.replace("Modulator", "")
+    tx_mod_bits = utils.bits_for_modulation(encoded_signal, modulator_name)
+
+    tx_symbols = mod.modulate(encoded_signal)
+    rx_symbols, _ = transmit_symbols(tx_symbols, channel, snr_db, pulse_shaper, ofdm)
+    return _count_uncoded_errors(rx_symbols, mod, tx_mod_bits)
+
+
+def simulate_coded_ber_point(data_bits: np.ndarray, encoded_signal: np.ndarray, code, enc, mod,
+                             channel, snr_db: float, pulse_shaper=None, ofdm=None) -> tuple[float, int, int]:
+    """Executa a cadeia com código de canal (ex.: LDPC) para um único ponto de SNR.
+
+    bits -> código -> encoder -> modulador -> `transmit_symbols` -> demodulação suave
+    (ponderada por N0/|h|^2 de cada símbolo) -> LLRs de linha -> LLRs de dados -> decodificador -> BER dos bits de informação.
+
+    - encoded_signal: `enc.encode(code.encode(data_bits))`, calculado uma única vez.
+
+    Retorna: (ber, errors, compared), como em `utils.compute_ber`.
+    """
+    tx_symbols = mod.modulate(encoded_signal)
+    rx_symbols, noise_var = transmit_symbols(tx_symbols, channel, snr_db, pulse_shaper, ofdm)
+    return _count_coded_errors(rx_symbols, noise_var, mod, enc, code, data_bits)
+
+
+def _modulation_prefix(encoded_signal: np.ndarray, mod, pulse_shaper, ofdm, coded: bool) -> dict:
+    modulator_name = mod.__class__.__name__.replace("Modulator", "")
+    return {
+        "tx": transmit_waveform(mod.modulate(encoded_signal), pulse_shaper, ofdm),
+        "reference": None if coded else utils.bits_for_modulation(encoded_signal, modulator_name),
+    }
+
+
+def _evaluate_point(prefix: dict, mod, enc, channel, snr_db: float, pulse_shaper, ofdm,
+                    code, data_bits: np.ndarray) -> tuple[float, int, int]:
+    rx_symbols, noise_var = receive_symbols(prefix["tx"], channel, snr_db, pulse_shaper, ofdm)
+    if code is not None:
+        return _count_coded_errors(rx_symbols, noise_var, mod, enc, code, data_bits)
+    return _count_uncoded_errors(rx_symbols, mod, prefix["reference"])
+
+
+def build_ber_plan(data_bits: np.ndarray, points: list, pulse_shaper=None, ofdm=None,
+                   code=None) -> planner.SweepPlan:
+    """Monta o DAG de uma varredura BER vs SNR.
+
+    bits -> [código] -> encoder -> modulador (+ OFDM/formatação de pulso) -> folhas por SNR.
+
+    - points: lista de (tag, EncoderID, ModulatorID, canal, snr_db); cada ponto vira uma
+      folha identificada por `tag`. Encoders e moduladores repetidos são compartilhados.
+
+    `plan.execute()` retorna {tag: (ber, errors, compared)}.
+    """
+    plan = planner.SweepPlan()
+    source = plan.node(("bits",), lambda: data_bits)
+    if code is not None:
+        source = plan.node(("code",), code.encode, parent=source)
+
+    encoders, modulators = {}, {}
+    for tag, enc_id, mod_id, channel, snr_db in points:
+        enc_id, mod_id = EncoderID(enc_id), ModulatorID(mod_id)
+        if enc_id not in encoders:
+            encoders[enc_id] = utils.select_encoder(enc_id)
+        if mod_id not in modulators:
+            modulators[mod_id] = utils.select_modulator(mod_id)
+        enc, mod = encoders[enc_id], modulators[mod_id]
+
+        enc_key = plan.node(("encode", enc_id), enc.encode, parent=source)
+        mod_key = plan.node(
+            ("modulate", enc_id, mod_id),
+            partial(_modulation_prefix, mod=mod, pulse_shaper=pulse_shaper, ofdm=ofdm, coded=code is not None),
+            parent=enc_key,
+        )
+        plan.leaf(tag, mod_key, partial(
+            _evaluate_point, mod=mod, enc=enc, channel=channel, snr_db=snr_db,
+            pulse_shaper=pulse_shaper, ofdm=ofdm, code=code, data_bits=data_bits,
+        ))
+    return plan
+
+
+def simulate_pipelined_ber_point(data_bits: np.ndarray, enc, mod, channel, snr_db: float,
+                                 pulse_shaper=None, ofdm=None, code=None,
+                                 frame_bits: int = 12288, queue_size: int = 4) -> tuple[float, int, int, dict]:
+    """Executa um ponto de SNR em quadros, com cada estágio da cadeia em seu próprio thread.
+
+    Estágios: encode -> modulate -> channel -> demodulate -> [decode] -> errors. Os quadros
+    de bits vêm de um `pipeline.BufferPool` e são devolvidos ao pool após a contagem de erros.
+    Apenas a entrada é reaproveitada: encoders, moduladores, canal e decodificador não
+    aceitam buffer de saída, então os arrays intermediários são alocados a cada quadro
+    (o pool limita, ainda assim, quantos quadros ficam em voo).
+
+    - frame_bits: bits de dados por quadro (arredondado para múltiplo de 12 e de `code.k`).
+      Assim só o último quadro recebe padding (bits 0 no modulador), como a mensagem
+      inteira no caminho sequencial, e a BER não depende do tamanho do quadro.
+    - queue_size: capacidade das filas entre estágios.
+
+    Retorna: (ber, errors, compared, estatísticas por estágio de `pipeline.PipelinedExecutor`).
+    """
+    modulator_name = mod.__class__.__name__.replace("Modulator", "")
+    encoder_name = enc.__class__.__name__.replace("Encoder", "")
+    align = int(np.lcm(12, code.k)) if code is not None else 12
+    frame_bits = max(align, -(-frame_bits // align) * align)
 
-from utils import EncoderID, ModulatorID, NoiseID
+    def encode(frame):
+        bits = frame["bits"]
+        if code is not None:
+            frame["line"] = enc.encode(code.encode(bits))
+        else:
+            frame["line"] = enc.encode(bits)
+            frame["reference"] = utils.bits_for_modulation(frame["line"], modulator_name)
+        return frame
+
+    def modulate(frame):
+        frame["tx"] = mod.modulate(frame["line"])
+        return frame
+
+    def transmit(frame):
+        frame["rx"], frame["noise_var"] = transmit_symbols(frame["tx"], channel, snr_db, pulse_shaper, ofdm)
+        return frame
+
+    def demodulate(frame):
+        if code is not None:
+            coded_length = -(-len(frame["bits"]) // code.k) * code.n
+            line_llr = modulator.soft_demodulate(mod, frame["rx"], frame["noise_var"])
+            frame["llr"] = utils.line_llrs_to_bit_llrs(line_llr, encoder_name, original_length=coded_length)
+        else:
+            frame["rx_bits"] = mod.demodulate(frame["rx"])
+        return frame
+
+    def decode(frame):
+        frame["rx_bits"] = code.decode(frame["llr"], original_length=len(frame["bits"]))
+        frame["reference"] = frame["bits"]
+        return frame
+
+    def count_errors(frame):
+        _, errors, compared = utils.compute_ber(frame["reference"], frame["rx_bits"])
+        pool.release(frame["buffer"])
+        return errors, compared
+
+    stages = [("encode", encode), ("modulate", modulate), ("channel", transmit), ("demodulate", demodulate)]
+    if code is not None:
+        stages.append(("decode", decode))
+    stages.append(("errors", count_errors))
+
+    pool = pipeline.BufferPool(queue_size + len(stages), frame_bits, dtype=int)
+
+    def frames():
+        for start in range(0, len(data_bits), frame_bits):
+            chunk = data_bits[start:start + frame_bits]
+            buffer = pool.acquire()
+            buffer[:len(chunk)] = chunk
+            yield {"buffer": buffer, "bits": buffer[:len(chunk)]}
+
+    executor = pipeline.PipelinedExecutor(stages, queue_size=queue_size)
+    outputs, stats = executor.run(frames(), discard=lambda frame: pool.release(frame["buffer"]))
+
+    errors = sum(e for e, _ in outputs)
+    compared = sum(c for _, c in outputs)
+    ber = errors / compared if compared else 0.0
+    return ber, errors, compared, stats
+
+
+def _theory_label(mod_id: ModulatorID) -> str:
+    """Rótulo da curva teórica de um modulador (Gray, bits equiprováveis)."""
+    return f"Teoria {ModulatorID(mod_id).name} (bits equiprováveis)"
+
+
+def plot_ber_curves(snr_list_db, series: dict, title_suffix: str = "", reference: dict | None = None) -> None:
+    """Plota as curvas BER vs SNR de `series` (label -> array de BERs).
+
+    - reference: curvas teóricas opcionais (label -> array), desenhadas tracejadas.
+    """
+    plt.figure(figsize=(14, 8))
+    for label, ber_arr in series.items():
+        plt.plot(snr_list_db, ber_arr, label=label, linewidth=2)
+    for label, ber_arr in (reference or {}).items():
+        plt.plot(snr_list_db, ber_arr, '--', color='black', alpha=0.6, label=label, linewidth=1.5)
+
+    plt.grid(True, alpha=0.3)
+    plt.xlabel('SNR (dB)', fontsize=13, fontweight='bold')
+    plt.ylabel('BER (Taxa de Erro de Bit)', fontsize=13, fontweight='bold')
+    
+    title = f'BER vs SNR - {title_suffix}'
+    plt.title(title, fontsize=14, fontweight='bold')
+    
+    plt.legend(loc='best', fontsize=9, ncol=2, framealpha=0.9)
+    plt.yscale('log')
+    plt.ylim(1e-5, 1)
+    plt.xlim(snr_list_db[0], snr_list_db[-1])
+    plt.tight_layout()
+    plt.show()
 
 
 def run_ber_snr_benchmark(
@@ -15,6 +329,15 @@ def run_ber_snr_benchmark(
     snr_list_db: list[float] | np.ndarray = None,
     combinations: list[tuple[EncoderID, ModulatorID]] | None = None,
     title_suffix: str = "",
+    pulse_shaper=None,
+    ofdm=None,
+    noise_id: NoiseID = NoiseID.AWGN,
+    channel_params: dict | None = None,
+    code_id: CodeID | None = None,
+    pipelined: bool = False,
+    mode: str = "simulate",
+    stage_stats: dict | None = None,
+    consistency: dict | None = None,
 ):
     """Executa benchmark BER vs SNR para múltiplas combinações Encoder+Modulador.
 
@@ -23,6 +346,32 @@ def run_ber_snr_benchmark(
     - snr_list_db: lista ou array de SNRs em dB (default 0..30 em passos de 1).
     - combinations: lista de tuplas (EncoderID, ModulatorID). Se None, usa um conjunto padrão.
     - title_suffix: sufixo adicional para o título do gráfico.
+    - pulse_shaper: estágio opcional de formatação de pulso/filtro casado
+      (ex.: `pulse_shaping.RRCPulseShaper(rolloff=0.35, sps=8)`).
+    - ofdm: modo de transmissão OFDM opcional (ex.: `ofdm.OFDMModem(n_fft=64, cp_len=16)`).
+    - noise_id: modelo de canal (AWGN, Rayleigh, Rician ou multipercurso). Em OFDM, o
+      quadro de desvanecimento é alinhado ao símbolo OFDM.
+    - channel_params: parâmetros do canal repassados a `utils.select_noise`
+      (ex.: {"k_factor": 10.0} no Rician, {"delays": ..., "pdp_db": ...} no multipercurso).
+    - code_id: código de canal opcional (ex.: CodeID.LDPC); a BER passa a ser a dos
+      bits de informação após a decodificação.
+    - pipelined: se True, cada ponto roda em quadros com um thread por estágio
+      (`simulate_pipelined_ber_point`).
+    - mode: "simulate" (padrão) ou "estimate". Em "estimate" retorna, sem simulação, a
+      BER teórica de cada modulador (`theory.ber_theory`, Gray, bits equiprováveis),
+      rotulada "Teoria X": é uma referência por modulador, não uma estimativa da cadeia
+      configurada (a codificação de linha e os mapeamentos não-Gray ficam de fora).
+      Apenas AWGN sem código de canal. Em "simulate" sobre AWGN sem código, as mesmas
+      curvas são sobrepostas como referência.
+    - stage_stats: dict opcional; com `pipelined=True`, recebe label -> estatísticas
+      por estágio somadas sobre os SNRs (ver `pipeline.format_stage_report`).
+    - consistency: dict opcional; em "simulate" sobre AWGN sem código, recebe
+      rótulo -> pontos fora do intervalo de confiança da teoria
+      (`theory.check_consistency`; lista vazia = consistente). BPSK e QPSK (Gray) têm
+      BER por bit independente da distribuição dos bits, então as próprias curvas da
+      varredura são verificadas; QAM16/QAM64 dependem dela após a codificação de
+      linha, e são verificados uma vez por modulador com bits aleatórios
+      (`theory.quick_mapping_check`, rótulo "QAMxx (bits aleatórios)").
 
     Retorna: dict(label -> np.ndarray de BERs) e plota o gráfico.
     """
@@ -30,64 +379,88 @@ def run_ber_snr_benchmark(
         snr_list_db = np.arange(0.0, 30.0 + 1.0, 1.0)
 
     if combinations is None:
-        combinations = [
-            (EncoderID.MANCHESTER, ModulatorID.BPSK),
-            (EncoderID.MANCHESTER, ModulatorID.QPSK),
-            (EncoderID.MANCHESTER, ModulatorID.QAM16),
-            (EncoderID.MANCHESTER, ModulatorID.QAM64),
-            (EncoderID.AMI_BIPOLAR, ModulatorID.BPSK),
-            (EncoderID.AMI_BIPOLAR, ModulatorID.QPSK),
-            (EncoderID.AMI_BIPOLAR, ModulatorID.QAM16),
-            (EncoderID.AMI_BIPOLAR, ModulatorID.QAM64),
-        ]
+        combinations = DEFAULT_COMBINATIONS
 
+    if mode not in ("simulate", "estimate"):
+        raise ValueError('Modo inválido. Use "simulate" ou "estimate".')
+    has_theory = code_id is None and int(noise_id) == NoiseID.AWGN
 
-    data_bits = data.text_to_bits(message)
-    awgn = utils.select_noise(NoiseID.AWGN)
-    series = {}
-    plt.figure(figsize=(14, 8))
+    if mode == "estimate":
+        if not has_theory:
+            raise ValueError("O modo estimate só está disponível para AWGN sem código de canal.")
+        series = {
+            _theory_label(mod_id): theory.ber_theory(mod_id, snr_list_db)
+            for mod_id in dict.fromkeys(ModulatorID(m) for _, m in combinations)
+        }
+        plot_ber_curves(snr_list_db, series, f"{title_suffix} (teórico)")
+        return series
 
+    data_bits = data.text_to_bits(message)
+    channel = utils.select_noise(noise_id, frame_len=ofdm.symbol_length if ofdm is not None else None,
+                                 channel_params=channel_params)
+    code = utils.select_code(code_id) if code_id is not None else None
+    labels = []
     for enc_id, mod_id in combinations:
-        enc = utils.select_encoder(enc_id)
-        mod = utils.select_modulator(mod_id)
-        encoder_name = enc.__class__.__name__.replace("Encoder", "")
-        modulator_name = mod.__class__.__name__.replace("Modulator", "")
-        label = f"{encoder_name} + {modulator_name}"
-
-        encoded_signal = enc.encode(data_bits)
-        tx_mod_bits = utils.bits_for_modulation(encoded_signal, modulator_name)
-
-        ber_list = []
-        for snr_db in snr_list_db:
-            tx_symbols = mod.modulate(encoded_signal)
-            rx_symbols = awgn.aplicar(tx_symbols, snr_db)
-            rx_bits = mod.demodulate(rx_symbols)
-            ber, errors, compared = utils.compute_ber(tx_mod_bits, rx_bits)
-            ber_list.append(ber)
-
-        ber_arr = np.array(ber_list)
-        series[label] = ber_arr
-        plt.plot(snr_list_db, ber_arr, label=label, linewidth=2)
+        label = combination_label(utils.select_encoder(enc_id), utils.select_modulator(mod_id))
+        if code is not None:
+            label += f" + {CodeID(code_id).name}"
+        labels.append(label)
 
-    plt.grid(True, alpha=0.3)
-    plt.xlabel('SNR (dB)', fontsize=13, fontweight='bold')
-    plt.ylabel('BER (Taxa de Erro de Bit)', fontsize=13, fontweight='bold')
-    
-    title = f'BER vs SNR - {title_suffix}'
-    plt.title(title, fontsize=14, fontweight='bold')
-    
-    plt.legend(loc='best', fontsize=9, ncol=2, framealpha=0.9)
-    plt.yscale('log')
-    plt.ylim(1e-5, 1)
-    plt.xlim(snr_list_db[0], snr_list_db[-1])
-    plt.tight_layout()
-    plt.show()
+    if pipelined:
+        results = {}  # (ci, si) -> (ber, errors, compared), como em `plan.execute()`
+        for ci, (enc_id, mod_id) in enumerate(combinations):
+            enc = utils.select_encoder(enc_id)
+            mod = utils.select_modulator(mod_id)
+            stats_list = []
+            for si, snr_db in enumerate(snr_list_db):
+                *results[(ci, si)], stats = simulate_pipelined_ber_point(
+                    data_bits, enc, mod, channel, snr_db, pulse_shaper, ofdm, code
+                )
+                stats_list.append(stats)
+            if stage_stats is not None:
+                stage_stats[labels[ci]] = pipeline.combine_stats(stats_list)
+    else:
+        # Prefixos determinísticos (código, encoder, modulador) calculados uma vez
+        points = [
+            ((ci, si), enc_id, mod_id, channel, snr_db)
+            for ci, (enc_id, mod_id) in enumerate(combinations)
+            for si, snr_db in enumerate(snr_list_db)
+        ]
+        results = build_ber_plan(data_bits, points, pulse_shaper, ofdm, code).execute()
+
+    series = {
+        label: np.array([results[(ci, si)][0] for si in range(len(snr_list_db))])
+        for ci, label in enumerate(labels)
+    }
+
+    reference = None
+    if has_theory:
+        # A teoria supõe bits equiprováveis e Gray; após a codificação de linha isso só
+        # não afeta a BER por bit do BPSK e do QPSK, verificados nos próprios pontos
+        reference = {}
+        for ci, (_, mod_id) in enumerate(combinations):
+            mod_id = ModulatorID(mod_id)
+            reference[_theory_label(mod_id)] = theory.ber_theory(mod_id, snr_list_db)
+            if consistency is None:
+                continue
+            if mod_id in (ModulatorID.BPSK, ModulatorID.QPSK):
+                counts = [results[(ci, si)] for si in range(len(snr_list_db))]
+                consistency[labels[ci]] = theory.check_consistency(
+                    mod_id, snr_list_db, [c[1] for c in counts], [c[2] for c in counts]
+                )
+            elif f"{mod_id.name} (bits aleatórios)" not in consistency:
+                consistency[f"{mod_id.name} (bits aleatórios)"] = theory.quick_mapping_check(mod_id, snr_list_db)
+
+    plot_ber_curves(snr_list_db, series, title_suffix, reference)
 
     return series
 
 
 if __name__ == "__main__":
     message = "A" * 10000  # msg de 10000 caracteres
+    pipelined = "--pipelined" in sys.argv  # um thread por estágio, com relatório de utilização
+    stage_stats = {}
+    consistency = {}
     
     print("\n" + "="*70)
     print("BENCHMARK BER vs SNR")
@@ -97,8 +470,19 @@ if __name__ == "__main__":
     # executar benchmark com configuração padrão
     results = run_ber_snr_benchmark(
         message=message,
-        title_suffix="Análise de Desempenho"
+        title_suffix="Análise de Desempenho",
+        pipelined=pipelined,
+        stage_stats=stage_stats,
+        consistency=consistency,
     )
+
+    for label, flagged in consistency.items():
+        if flagged:
+            snrs = ", ".join(f"{p['snr_db']:g}" for p in flagged)
+            print(f"[consistência] {label}: {len(flagged)} ponto(s) fora do intervalo teórico (SNR dB: {snrs})")
+
+    for label, stats in stage_stats.items():
+        print(f"\n{label}\n{pipeline.format_stage_report(stats)}")
     
     print("\n" + "="*70)
     print("BENCHMARK CONCLUÍDO!")
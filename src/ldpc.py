@@ -0,0 +1,217 @@
+import numpy as np
+import scipy.sparse as sp
+
+# Matriz base QC-LDPC (deslocamentos cíclicos; -1 = bloco nulo) no formato do
+# IEEE 802.11n, n = 648, taxa 1/2, fator de expansão Z = 27.
+BASE_MATRIX_648_R12 = np.array([
+    [ 0, -1, -1, -1,  0,  0, -1, -1,  0, -1, -1,  0,  1,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [22,  0, -1, -1, 17, -1,  0,  0, 12, -1, -1, -1, -1,  0,  0, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 6, -1,  0, -1, 10, -1, -1, -1, 24, -1,  0, -1, -1, -1,  0,  0, -1, -1, -1, -1, -1, -1, -1, -1],
+    [ 2, -1, -1,  0, 20, -1, -1, -1, 25,  0, -1, -1, -1, -1, -1,  0,  0, -1, -1, -1, -1, -1, -1, -1],
+    [23, -1, -1, -1,  3, -1, -1, -1,  0, -1,  9, 11, -1, -1, -1, -1,  0,  0, -1, -1, -1, -1, -1, -1],
+    [24, -1, 23,  1, 17, -1,  3, -1, 10, -1, -1, -1, -1, -1, -1, -1, -1,  0,  0, -1, -1, -1, -1, -1],
+    [25, -1, -1, -1,  8, -1, -1, -1,  7, 18, -1, -1,  0, -1, -1, -1, -1, -1,  0,  0, -1, -1, -1, -1],
+    [13, 24, -1, -1,  0, -1,  8, -1,  6, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  0,  0, -1, -1, -1],
+    [ 7, 20, -1, 16, 22, 10, -1, -1, 23, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  0,  0, -1, -1],
+    [11, -1, -1, -1, 19, -1, -1, -1, 13, -1,  3, 17, -1, -1, -1, -1, -1, -1, -1, -1, -1,  0,  0, -1],
+    [25, -1,  8, -1, 23, 18, -1, 14,  9, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  0,  0],
+    [ 3, -1, -1, -1, 16, -1, -1,  2, 25,  5, -1, -1,  1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  0],
+])
+BASE_MATRIX_648_R12_Z = 27
+
+_PAD_MAGNITUDE = 1e30  # magnitude das arestas fictícias usadas para alinhar as linhas
+
+
+def expand_base_matrix(base: np.ndarray, z: int) -> sp.csr_matrix:
+    """
+    Expande uma matriz base QC-LDPC em H esparsa: cada entrada s >= 0 vira a
+    identidade Z x Z deslocada ciclicamente de s colunas; -1 vira bloco nulo.
+    """
+    base = np.asarray(base)
+    rows, cols = [], []
+    offsets = np.arange(z)
+    for i, j in zip(*np.nonzero(base >= 0)):
+        shift = base[i, j]
+        rows.append(i * z + offsets)
+        cols.append(j * z + (offsets + shift) % z)
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    data = np.ones(len(rows), dtype=np.uint8)
+    return sp.csr_matrix((data, (rows, cols)), shape=(base.shape[0] * z, base.shape[1] * z))
+
+
+def _gf2_systematic(H: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Eliminação gaussiana em GF(2). Retorna (colunas de informação, colunas de
+    paridade, P) tal que c[paridade] = P @ c[informação] (mod 2) satisfaz H c = 0.
+    """
+    A = (np.asarray(H) % 2).astype(np.uint8)
+    m, n = A.shape
+    pivot_cols = []
+    row = 0
+    for col in range(n):
+        if row == m:
+            break
+        candidates = np.nonzero(A[row:, col])[0]
+        if len(candidates) == 0:
+            continue
+        pivot = row + candidates[0]
+        if pivot != row:
+            A[[row, pivot]] = A[[pivot, row]]
+        # Zera a coluna em todas as outras linhas (forma escalonada reduzida)
+        others = np.nonzero(A[:, col])[0]
+        others = others[others != row]
+        A[others] ^= A[row]
+        pivot_cols.append(col)
+        row += 1
+
+    parity_cols = np.array(pivot_cols, dtype=int)
+    info_cols = np.setdiff1d(np.arange(n), parity_cols)
+    P = A[:len(parity_cols)][:, info_cols]
+    return info_cols, parity_cols, P
+
+
+class LDPCCode:
+    """
+    Código LDPC com decodificação min-sum normalizada vetorizada.
+
+    - H: matriz de verificação de paridade (densa ou `scipy.sparse`).
+    - max_iter: número máximo de iterações do decodificador.
+    - alpha: fator de normalização do min-sum (1.0 = min-sum puro).
+
+    A decodificação opera sobre todas as arestas do grafo de Tanner e sobre um lote
+    de palavras-código de uma vez, com parada antecipada de cada palavra assim que
+    a síndrome é nula. Convenção de LLR: log(P(bit=0) / P(bit=1)).
+    """
+
+    def __init__(self, H, max_iter: int = 50, alpha: float = 0.75):
+        self.H = sp.csr_matrix(H, dtype=np.uint8)
+        self.H.sum_duplicates()
+        self.H.eliminate_zeros()
+        self.m, self.n = self.H.shape
+        self.max_iter = int(max_iter)
+        self.alpha = float(alpha)
+
+        self.info_cols, self.parity_cols, self._P = _gf2_systematic(self.H.toarray())
+        self.k = len(self.info_cols)
+        if self.k == 0:
+            raise ValueError("Matriz H sem bits de informação (posto completo em todas as colunas).")
+
+        # Arestas do grafo de Tanner, ordenadas por linha (nó de verificação)
+        coo = self.H.tocoo()
+        order = np.lexsort((coo.col, coo.row))
+        self.edge_row = coo.row[order]
+        self.edge_col = coo.col[order]
+        n_edges = len(self.edge_row)
+
+        # Índices das arestas de cada linha, alinhados em (m, grau máximo);
+        # posições vazias apontam para uma aresta fictícia (índice n_edges)
+        degrees = np.bincount(self.edge_row, minlength=self.m)
+        starts = np.concatenate([[0], np.cumsum(degrees)[:-1]])
+        slot = np.arange(n_edges) - starts[self.edge_row]
+        self._row_edges = np.full((self.m, degrees.max()), n_edges)
+        self._row_edges[self.edge_row, slot] = np.arange(n_edges)
+        self._row_valid = self._row_edges < n_edges
+
+        # Incidência aresta -> variável para somar mensagens por coluna
+        self._edge_to_var = sp.csr_matrix(
+            (np.ones(n_edges), (np.arange(n_edges), self.edge_col)), shape=(n_edges, self.n)
+        )
+
+    @classmethod
+    def from_base_matrix(cls, base: np.ndarray, z: int, **kwargs) -> "LDPCCode":
+        """Cria o código a partir de uma matriz base QC-LDPC e fator de expansão Z."""
+        return cls(expand_base_matrix(base, z), **kwargs)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "LDPCCode":
+        """Carrega H de um arquivo `.npz` salvo com `scipy.sparse.save_npz`."""
+        return cls(sp.load_npz(path), **kwargs)
+
+    @property
+    def rate(self) -> float:
+        return self.k / self.n
+
+    def encode(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Codifica os bits de informação em blocos de k bits (o último bloco é
+        completado com zeros) e retorna as palavras-código concatenadas.
+        """
+        bits = np.asarray(bits, dtype=np.uint8).flatten()
+        n_blocks = max(1, -(-len(bits) // self.k))
+        info = np.zeros(n_blocks * self.k, dtype=np.uint8)
+        info[:len(bits)] = bits
+        info = info.reshape(n_blocks, self.k)
+
+        codewords = np.zeros((n_blocks, self.n), dtype=np.uint8)
+        codewords[:, self.info_cols] = info
+        codewords[:, self.parity_cols] = (info.astype(np.int64) @ self._P.T.astype(np.int64)) % 2
+        return codewords.reshape(-1).astype(int)
+
+    def syndrome(self, codewords: np.ndarray) -> np.ndarray:
+        """Síndrome H c (mod 2) de cada palavra, com forma (lote, m)."""
+        codewords = np.atleast_2d(codewords)
+        return (self.H @ codewords.T.astype(np.int64)).T % 2
+
+    def _check_update(self, Q: np.ndarray) -> np.ndarray:
+        """Mensagens verificação -> variável (min-sum normalizado) para todas as arestas."""
+        batch = Q.shape[0]
+        Qp = np.concatenate([Q, np.full((batch, 1), _PAD_MAGNITUDE)], axis=1)[:, self._row_edges]
+        mag = np.abs(Qp)
+        neg = Qp < 0
+
+        # Menor e segundo menor |Q| de cada linha
+        idx1 = np.argmin(mag, axis=2)
+        min1 = np.take_along_axis(mag, idx1[..., None], axis=2)
+        np.put_along_axis(mag, idx1[..., None], np.inf, axis=2)
+        min2 = np.min(mag, axis=2, keepdims=True)
+
+        is_min = np.arange(mag.shape[2]) == idx1[..., None]
+        out_mag = np.where(is_min, min2, min1)
+        # Sinal = produto dos sinais das outras arestas da linha
+        parity = (np.sum(neg, axis=2, keepdims=True) + neg) % 2
+        R = self.alpha * np.where(parity == 1, -out_mag, out_mag)
+        return R[:, self._row_valid]
+
+    def decode_llr(self, llr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Decodifica um lote de palavras a partir das LLRs do canal.
+
+        - llr: array com forma (lote, n) ou (lote * n,).
+
+        Retorna: (palavras-código decididas (lote, n), iterações usadas por palavra).
+        """
+        llr = np.asarray(llr, dtype=float).reshape(-1, self.n)
+        batch = llr.shape[0]
+        decided = (llr < 0).astype(np.uint8)
+        iterations = np.zeros(batch, dtype=int)
+
+        active = np.nonzero(np.any(self.syndrome(decided), axis=1))[0]
+        R = np.zeros((len(active), len(self.edge_row)))
+        for it in range(1, self.max_iter + 1):
+            if len(active) == 0:
+                break
+            ch = llr[active]
+            posterior = ch + (self._edge_to_var.T @ R.T).T
+            Q = posterior[:, self.edge_col] - R
+            R = self._check_update(Q)
+
+            posterior = ch + (self._edge_to_var.T @ R.T).T
+            hard = (posterior < 0).astype(np.uint8)
+            decided[active] = hard
+            iterations[active] = it
+
+            # Parada antecipada: remove do lote as palavras com síndrome nula
+            still = np.any(self.syndrome(hard), axis=1)
+            active = active[still]
+            R = R[still]
+
+        return decided, iterations
+
+    def decode(self, llr: np.ndarray, original_length: int | None = None) -> np.ndarray:
+        """Decodifica as LLRs e retorna os bits de informação concatenados."""
+        codewords, _ = self.decode_llr(llr)
+        bits = codewords[:, self.info_cols].reshape(-1).astype(int)
+        if original_length is not None:
+            bits = bits[:original_length]
+        return bits
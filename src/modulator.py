@@ -16,6 +16,19 @@ def _smart_signal_to_bits(signal: np.ndarray) -> np.ndarray:
         # Lógica Manchester/BPSK: Nível positivo é 1, negativo é 0
         return ((signal + 1) / 2).astype(int)
 
+def _bits_in_groups(signal: np.ndarray, group: int) -> np.ndarray:
+    """
+    Converte os níveis de linha em bits e completa com bits 0 até um múltiplo de `group`.
+
+    A conversão vem antes do padding: completar os níveis com zeros faria
+    `_smart_signal_to_bits` tomar um sinal Manchester por AMI.
+    """
+    bits = _smart_signal_to_bits(np.asarray(signal))
+    pad_length = (group - len(bits) % group) % group
+    if pad_length:
+        bits = np.append(bits, np.zeros(pad_length, dtype=int))
+    return bits
+
 class BPSKModulator:
     """BPSK: 1 bit por símbolo"""
     
@@ -53,11 +66,7 @@ class QPSKModulator:
     
     def modulate(self, signal: np.ndarray) -> np.ndarray:
         """Modula usando QPSK"""
-        pad_length = len(signal) % 2
-        if pad_length:
-            signal = np.append(signal, [0]) # Padding com 0 mantém lógica do AMI se necessário
-        
-        bits = _smart_signal_to_bits(signal)
+        bits = _bits_in_groups(signal, 2)
         
         num_symbols = len(bits) // 2
         modulated = np.zeros(num_symbols, dtype=complex)
@@ -93,11 +102,7 @@ class QAM16Modulator:
     
     def modulate(self, signal: np.ndarray) -> np.ndarray:
         """Modula usando 16-QAM"""
-        pad_length = (4 - len(signal) % 4) % 4
-        if pad_length > 0:
-            signal = np.append(signal, np.zeros(pad_length))
-        
-        bits = _smart_signal_to_bits(signal)
+        bits = _bits_in_groups(signal, 4)
         
         num_symbols = len(bits) // 4
         modulated = np.zeros(num_symbols, dtype=complex)
@@ -140,11 +145,7 @@ class QAM64Modulator:
     
     def modulate(self, signal: np.ndarray) -> np.ndarray:
         """Modula usando 64-QAM"""
-        pad_length = (6 - len(signal) % 6) % 6
-        if pad_length > 0:
-            signal = np.append(signal, np.zeros(pad_length))
-        
-        bits = _smart_signal_to_bits(signal)
+        bits = _bits_in_groups(signal, 6)
         
         num_symbols = len(bits) // 6
         modulated = np.zeros(num_symbols, dtype=complex)
@@ -166,9 +167,33 @@ class QAM64Modulator:
             bits_out.extend(bit_groups[idx])
         return np.array(bits_out, dtype=int)
 
-class QAM64Modulator:
-    """64-QAM: 6 bits por símbolo com Gray coding"""
-    
+def soft_demodulate(modulator, received: np.ndarray, noise_var=1.0) -> np.ndarray:
+    """
+    Demodulação suave (max-log): LLR = log(P(bit=0) / P(bit=1)) de cada bit.
+
+    Funciona para qualquer modulador com `constellation` (bits -> símbolo); a
+    constelação é normalizada para energia média unitária, como em `modulate`.
+
+    - noise_var: N0 de cada símbolo recebido (escalar ou um valor por símbolo).
+      Após equalização zero-forcing, N0/|h|^2: símbolos em desvanecimento profundo
+      recebem LLRs pequenas. O min-sum só é invariante a uma escala global, então
+      com ganhos de canal variáveis o valor por símbolo é necessário.
+    """
+    bit_labels = np.array(list(modulator.constellation.keys()), dtype=int)
+    points = np.array(list(modulator.constellation.values()), dtype=complex)
+    points = points / np.sqrt(np.mean(np.abs(points) ** 2))
+
+    received = np.asarray(received)
+    d2 = np.abs(received[:, None] - points[None, :]) ** 2  # (símbolos, pontos)
+    llr = np.empty((len(received), bit_labels.shape[1]))
+    for b in range(bit_labels.shape[1]):
+        zero = bit_labels[:, b] == 0
+        llr[:, b] = np.min(d2[:, ~zero], axis=1) - np.min(d2[:, zero], axis=1)
+    noise_var = np.asarray(noise_var, dtype=float)
+    if noise_var.ndim:
+        noise_var = noise_var[:, None]
+    return (llr / noise_var).reshape(-1)
+
 def plot_constellation(modulator):
     plt.figure(figsize=(8, 8))
     for bits, symbol in modulator.constellation.items():
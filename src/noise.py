@@ -1,5 +1,37 @@
 import numpy as np
 
+
+def _potencia_media(signal: np.ndarray) -> float:
+    """
+    Potência média do sinal (real ou complexo).
+    """
+    if np.iscomplexobj(signal):
+        return np.mean(np.abs(signal) ** 2)
+    return np.mean(signal ** 2)
+
+
+def _gerar_ruido(rng: np.random.Generator, shape, noise_power: float, complexo: bool) -> np.ndarray:
+    """
+    Gera ruído gaussiano de densidade N0 = `noise_power`, real ou complexo.
+
+    Todos os canais usam SNR = Es/N0: o ruído complexo n_I + j n_Q tem variância
+    N0/2 por dimensão, e em sinais reais só a componente em fase (N0/2) é somada.
+    Assim o BPSK tem a mesma BER em portadora única, OFDM ou canal com
+    desvanecimento, e o Rician com K -> infinito se reduz ao AWGN.
+    """
+    sigma = np.sqrt(noise_power / 2.0)
+    if complexo:
+        return rng.normal(0.0, sigma, size=shape) + 1j * rng.normal(0.0, sigma, size=shape)
+    return rng.normal(0.0, sigma, size=shape)
+
+
+def _ganhos_rayleigh(rng: np.random.Generator, shape) -> np.ndarray:
+    """
+    Coeficientes gaussianos complexos CN(0, 1).
+    """
+    return (rng.standard_normal(shape) + 1j * rng.standard_normal(shape)) / np.sqrt(2.0)
+
+
 class AWGNNoise:
     """
     Classe de ruído AWGN (Gaussiano Branco Aditivo).
@@ -8,31 +40,39 @@ class AWGNNoise:
 
     def __init__(self, rng: np.random.Generator | None = None):
         self.rng = rng or np.random.default_rng()
+        self.noise_power = None  # N0 da última chamada a `aplicar`
 
     def aplicar(self, signal: np.ndarray, snr_db: float) -> np.ndarray:
         """
-        Aplica AWGN ao `signal` com SNR em dB.
+        Aplica AWGN ao `signal` com SNR (Es/N0) em dB.
         """
         # Potência média do sinal
-        if np.iscomplexobj(signal):
-            signal_power = np.mean(np.abs(signal) ** 2)
-        else:
-            signal_power = np.mean(signal ** 2)
+        signal_power = _potencia_media(signal)
 
-        # Converte SNR de dB para linear e deriva a potência do ruído
+        # Converte SNR de dB para linear e deriva a potência do ruído (N0)
         snr_linear = 10 ** (snr_db / 10.0)
         noise_power = signal_power / snr_linear
+        self.noise_power = noise_power
 
-        # Gera ruído compatível com o tipo do sinal
-        if np.iscomplexobj(signal):
-            # Baseband complexo: ruído = n_I + j n_Q, cada um com variância = noise_power/2
-            sigma = np.sqrt(noise_power / 2.0)
-            noise = self.rng.normal(0.0, sigma, size=signal.shape) + 1j * self.rng.normal(0.0, sigma, size=signal.shape)
-        else:
-            sigma = np.sqrt(noise_power)
-            noise = self.rng.normal(0.0, sigma, size=signal.shape)
+        return signal + _gerar_ruido(self.rng, signal.shape, noise_power, np.iscomplexobj(signal))
+
+    def equalizar(self, received: np.ndarray) -> np.ndarray:
+        """
+        Canal sem desvanecimento: não há nada a equalizar.
+        """
+        return received
 
-        return signal + noise
+    def variancia_ruido(self, n: int) -> np.ndarray:
+        """
+        N0 por amostra após `equalizar` (constante no AWGN).
+        """
+        return np.full(n, self.noise_power)
+
+    def resposta_frequencia(self, n_fft: int) -> np.ndarray | None:
+        """
+        AWGN não tem resposta de canal a informar (o receptor usa os pilotos).
+        """
+        return None
 
     def plot_constelacao_ruido(self, modulador, sinal_ruidoso: np.ndarray, snr_db: float) -> None:
         """
@@ -64,3 +104,179 @@ class AWGNNoise:
         plt.legend()
         plt.axis('equal')
         plt.show()
+
+
+class RicianFadingNoise:
+    """
+    Canal com desvanecimento plano Rician em blocos + AWGN.
+
+    O sinal é dividido em quadros de `frame_len` amostras; cada quadro recebe um
+    único coeficiente h = sqrt(K/(K+1)) + sqrt(1/(K+1)) * CN(0, 1), gerado de uma
+    vez para todos os quadros. E[|h|^2] = 1, então `snr_db` é a SNR média.
+    Os coeficientes da última chamada ficam disponíveis para equalização com
+    CSI perfeita (`equalizar`).
+    """
+
+    def __init__(self, k_factor: float = 4.0, frame_len: int = 64, rng: np.random.Generator | None = None):
+        if k_factor < 0:
+            raise ValueError("O fator K deve ser >= 0.")
+        if frame_len < 1:
+            raise ValueError("frame_len deve ser >= 1.")
+        self.k_factor = float(k_factor)
+        self.frame_len = int(frame_len)
+        self.rng = rng or np.random.default_rng()
+        self.ganhos = None  # um coeficiente por quadro da última chamada a `aplicar`
+        self.noise_power = None  # N0 da última chamada a `aplicar`
+
+    def _gerar_ganhos(self, n_frames: int) -> np.ndarray:
+        k = self.k_factor
+        los = np.sqrt(k / (k + 1.0))
+        return los + np.sqrt(1.0 / (k + 1.0)) * _ganhos_rayleigh(self.rng, n_frames)
+
+    def _ganhos_por_amostra(self, n: int) -> np.ndarray:
+        return np.repeat(self.ganhos, self.frame_len)[:n]
+
+    def aplicar(self, signal: np.ndarray, snr_db: float) -> np.ndarray:
+        """
+        Aplica o desvanecimento por quadro e o AWGN ao `signal` com SNR média em dB.
+        """
+        signal = np.asarray(signal)
+        n_frames = -(-len(signal) // self.frame_len)
+        self.ganhos = self._gerar_ganhos(n_frames)
+
+        self.noise_power = _potencia_media(signal) / 10 ** (snr_db / 10.0)
+        faded = signal * self._ganhos_por_amostra(len(signal))
+        return faded + _gerar_ruido(self.rng, signal.shape, self.noise_power, True)
+
+    def equalizar(self, received: np.ndarray) -> np.ndarray:
+        """
+        Equalização zero-forcing com CSI perfeita (divide pelo ganho de cada quadro).
+        """
+        return received / self._ganhos_por_amostra(len(received))
+
+    def variancia_ruido(self, n: int) -> np.ndarray:
+        """
+        N0 por amostra após `equalizar`: N0 / |h|^2 do quadro de cada amostra.
+        """
+        return self.noise_power / np.abs(self._ganhos_por_amostra(n)) ** 2
+
+    def resposta_frequencia(self, n_fft: int) -> np.ndarray:
+        """
+        Resposta em frequência por quadro, com forma (n_quadros, n_fft).
+        """
+        return np.repeat(self.ganhos[:, None], n_fft, axis=1)
+
+
+class RayleighFadingNoise(RicianFadingNoise):
+    """
+    Canal com desvanecimento plano Rayleigh em blocos + AWGN (Rician com K = 0).
+    """
+
+    def __init__(self, frame_len: int = 64, rng: np.random.Generator | None = None):
+        super().__init__(k_factor=0.0, frame_len=frame_len, rng=rng)
+
+
+class MultipathNoise:
+    """
+    Canal multipercurso (tapped delay line) com desvanecimento Rayleigh em blocos + AWGN.
+
+    - delays: atraso de cada percurso, em amostras.
+    - pdp_db: perfil de potência-atraso (dB) de cada percurso; normalizado para
+      potência total unitária.
+    - frame_len: amostras por quadro; cada quadro sorteia novos coeficientes.
+
+    A convolução é circular dentro de cada quadro e feita via FFT para todos os
+    quadros de uma vez, o que equivale a transmitir cada quadro com prefixo cíclico
+    >= atraso máximo (SC-FDE). Para OFDM, use `frame_len` igual ao tamanho do
+    símbolo OFDM (FFT + CP) e CP >= atraso máximo.
+    """
+
+    def __init__(self, delays=(0, 1, 2, 3), pdp_db=(0.0, -3.0, -6.0, -9.0),
+                 frame_len: int = 256, rng: np.random.Generator | None = None):
+        delays = np.asarray(delays, dtype=int)
+        pdp = 10 ** (np.asarray(pdp_db, dtype=float) / 10.0)
+        if len(delays) != len(pdp) or len(delays) == 0:
+            raise ValueError("delays e pdp_db devem ter o mesmo tamanho (>= 1).")
+        if np.any(delays < 0) or delays.max() >= frame_len:
+            raise ValueError("Os atrasos devem estar entre 0 e frame_len - 1.")
+
+        self.delays = delays
+        self.pdp = pdp / np.sum(pdp)
+        self.frame_len = int(frame_len)
+        self.rng = rng or np.random.default_rng()
+        self.taps = None  # resposta ao impulso por quadro da última chamada, (n_quadros, atraso máx. + 1)
+        self.noise_power = None  # N0 da última chamada a `aplicar`
+
+    def _gerar_taps(self, n_frames: int) -> np.ndarray:
+        taps = np.zeros((n_frames, self.delays.max() + 1), dtype=complex)
+        coef = _ganhos_rayleigh(self.rng, (n_frames, len(self.delays))) * np.sqrt(self.pdp)
+        np.add.at(taps, (slice(None), self.delays), coef)
+        return taps
+
+    def _por_quadro(self, x: np.ndarray, op) -> np.ndarray:
+        """
+        Aplica `op(quadros_fft, H)` no domínio da frequência, quadro a quadro (em lote).
+        O último quadro, se incompleto, é processado com o próprio tamanho.
+        """
+        n = len(x)
+        n_full = n // self.frame_len
+        out = np.empty(n, dtype=complex)
+
+        if n_full:
+            frames = x[:n_full * self.frame_len].reshape(n_full, self.frame_len)
+            H = np.fft.fft(self.taps[:n_full], self.frame_len, axis=1)
+            out[:n_full * self.frame_len] = np.fft.ifft(op(np.fft.fft(frames, axis=1), H), axis=1).reshape(-1)
+
+        rem = n - n_full * self.frame_len
+        if rem:
+            H = self._resposta_parcial(n_full, rem)
+            out[n_full * self.frame_len:] = np.fft.ifft(op(np.fft.fft(x[n_full * self.frame_len:]), H))
+
+        return out
+
+    def _resposta_parcial(self, frame: int, rem: int) -> np.ndarray:
+        """Resposta em frequência de um quadro incompleto de `rem` amostras."""
+        # Taps além do tamanho do quadro parcial se sobrepõem (circular)
+        h = self.taps[frame]
+        h_rem = np.zeros(rem, dtype=complex)
+        np.add.at(h_rem, np.arange(len(h)) % rem, h)
+        return np.fft.fft(h_rem)
+
+    def aplicar(self, signal: np.ndarray, snr_db: float) -> np.ndarray:
+        """
+        Aplica o canal multipercurso e o AWGN ao `signal` com SNR média em dB.
+        """
+        signal = np.asarray(signal)
+        n_frames = -(-len(signal) // self.frame_len)
+        self.taps = self._gerar_taps(n_frames)
+
+        self.noise_power = _potencia_media(signal) / 10 ** (snr_db / 10.0)
+        faded = self._por_quadro(signal, lambda X, H: X * H)
+        return faded + _gerar_ruido(self.rng, signal.shape, self.noise_power, True)
+
+    def equalizar(self, received: np.ndarray) -> np.ndarray:
+        """
+        Equalização zero-forcing no domínio da frequência com CSI perfeita.
+        """
+        return self._por_quadro(np.asarray(received), lambda Y, H: Y / H)
+
+    def variancia_ruido(self, n: int) -> np.ndarray:
+        """
+        N0 por amostra após `equalizar`: N0 * média(1/|H_k|^2) do quadro de cada amostra
+        (o ZF amplifica o ruído nas subportadoras fracas e o espalha pelo quadro).
+        """
+        n_full = n // self.frame_len
+        out = np.empty(n)
+        if n_full:
+            H = np.fft.fft(self.taps[:n_full], self.frame_len, axis=1)
+            out[:n_full * self.frame_len] = np.repeat(np.mean(1.0 / np.abs(H) ** 2, axis=1), self.frame_len)
+        rem = n - n_full * self.frame_len
+        if rem:
+            out[n_full * self.frame_len:] = np.mean(1.0 / np.abs(self._resposta_parcial(n_full, rem)) ** 2)
+        return self.noise_power * out
+
+    def resposta_frequencia(self, n_fft: int) -> np.ndarray:
+        """
+        Resposta em frequência por quadro, com forma (n_quadros, n_fft).
+        """
+        return np.fft.fft(self.taps, n_fft, axis=1)
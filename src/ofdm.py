@@ -0,0 +1,116 @@
+import numpy as np
+
+
+class OFDMModem:
+    """
+    Transmissão OFDM sobre os símbolos de qualquer modulador (BPSK, QPSK, QAM...).
+
+    Fica entre o modulador e o canal:
+        símbolos -> modulate() -> canal -> demodulate() -> símbolos -> demodulador
+
+    - n_fft: número de subportadoras (tamanho da FFT).
+    - cp_len: tamanho do prefixo cíclico em amostras.
+    - pilot_spacing: uma subportadora piloto a cada `pilot_spacing` (0 desativa pilotos).
+    - pilot_value: símbolo conhecido transmitido nos pilotos.
+    - static_channel: se True, a estimativa LS dos pilotos é promediada sobre todos os
+      símbolos OFDM recebidos (canal constante no bloco); se False, cada símbolo OFDM
+      usa apenas os próprios pilotos.
+
+    IFFT/FFT são feitas de uma vez sobre todos os símbolos OFDM (lote 2-D) com
+    normalização "ortho", então a potência por amostra é a mesma dos símbolos e a
+    SNR do canal equivale à SNR por subportadora. Como o canal soma N0/2 por
+    dimensão também a sinais reais, o BPSK tem a mesma BER em OFDM e em
+    portadora única.
+    """
+
+    def __init__(self, n_fft: int = 64, cp_len: int = 16, pilot_spacing: int = 8,
+                 pilot_value: complex = 1 + 0j, static_channel: bool = True):
+        if n_fft < 2:
+            raise ValueError("n_fft deve ser >= 2.")
+        if not 0 <= cp_len <= n_fft:
+            raise ValueError("cp_len deve estar entre 0 e n_fft.")
+
+        self.n_fft = int(n_fft)
+        self.cp_len = int(cp_len)
+        self.pilot_value = complex(pilot_value)
+        self.static_channel = static_channel
+
+        carriers = np.arange(self.n_fft)
+        if pilot_spacing:
+            self.pilot_indices = carriers[::int(pilot_spacing)]
+        else:
+            self.pilot_indices = carriers[:0]
+        self.data_indices = np.setdiff1d(carriers, self.pilot_indices)
+        if len(self.data_indices) == 0:
+            raise ValueError("Nenhuma subportadora de dados disponível.")
+
+        # Matriz de interpolação linear (circular na frequência) pilotos -> subportadoras
+        n_pilots = len(self.pilot_indices)
+        self._interp = np.empty((n_pilots, self.n_fft))
+        for p in range(n_pilots):
+            self._interp[p] = np.interp(carriers, self.pilot_indices, np.eye(n_pilots)[p], period=self.n_fft)
+
+    @property
+    def symbol_length(self) -> int:
+        """Amostras por símbolo OFDM (FFT + prefixo cíclico)."""
+        return self.n_fft + self.cp_len
+
+    def num_ofdm_symbols(self, num_symbols: int) -> int:
+        """Quantidade de símbolos OFDM necessária para `num_symbols` símbolos de dados."""
+        return -(-num_symbols // len(self.data_indices))
+
+    def modulate(self, symbols: np.ndarray) -> np.ndarray:
+        """Mapeia os símbolos nas subportadoras e gera o sinal OFDM no tempo (com CP)."""
+        symbols = np.asarray(symbols)
+        n_data = len(self.data_indices)
+        n_ofdm = self.num_ofdm_symbols(len(symbols))
+
+        padded = np.zeros(n_ofdm * n_data, dtype=complex)
+        padded[:len(symbols)] = symbols
+
+        grid = np.zeros((n_ofdm, self.n_fft), dtype=complex)
+        grid[:, self.data_indices] = padded.reshape(n_ofdm, n_data)
+        grid[:, self.pilot_indices] = self.pilot_value
+
+        time = np.fft.ifft(grid, axis=1, norm="ortho")
+        with_cp = np.concatenate([time[:, self.n_fft - self.cp_len:], time], axis=1)
+        return with_cp.reshape(-1)
+
+    def estimate_channel(self, rx_grid: np.ndarray) -> np.ndarray:
+        """Estimativa LS nos pilotos, interpolada para todas as subportadoras."""
+        if len(self.pilot_indices) == 0:
+            return np.ones_like(rx_grid)
+        h_pilots = rx_grid[:, self.pilot_indices] / self.pilot_value
+        if self.static_channel:
+            h_pilots = np.mean(h_pilots, axis=0, keepdims=True)
+        h = h_pilots @ self._interp
+        return np.broadcast_to(h, rx_grid.shape)
+
+    def demodulate(self, received: np.ndarray, num_symbols: int,
+                   channel_response: np.ndarray | None = None, return_channel: bool = False):
+        """
+        Remove o CP, aplica a FFT e equaliza cada subportadora (um tap).
+
+        - num_symbols: quantidade de símbolos de dados transmitidos.
+        - channel_response: resposta em frequência conhecida (CSI perfeita), com forma
+          (n_fft,) ou (n_símbolos_ofdm, n_fft). Se None, usa a estimativa pelos pilotos.
+        - return_channel: se True, retorna (símbolos, H da subportadora de cada símbolo),
+          usado para ponderar as LLRs por |H_k|^2.
+        """
+        n_ofdm = self.num_ofdm_symbols(num_symbols)
+        frames = np.asarray(received)[:n_ofdm * self.symbol_length].reshape(n_ofdm, self.symbol_length)
+        rx_grid = np.fft.fft(frames[:, self.cp_len:], axis=1, norm="ortho")
+
+        if channel_response is None:
+            h = self.estimate_channel(rx_grid)
+        else:
+            channel_response = np.asarray(channel_response)
+            if channel_response.ndim == 2 and channel_response.shape[0] != n_ofdm:
+                raise ValueError("A resposta do canal deve ter um quadro por símbolo OFDM (frame_len = n_fft + cp_len).")
+            h = np.broadcast_to(channel_response, rx_grid.shape)
+
+        h_data = h[:, self.data_indices]
+        equalized = (rx_grid[:, self.data_indices] / h_data).reshape(-1)[:num_symbols]
+        if return_channel:
+            return equalized, h_data.reshape(-1)[:num_symbols]
+        return equalized
@@ -0,0 +1,170 @@
+"""
+Execução em pipeline da cadeia de transmissão, com um thread por estágio.
+
+Os estágios (ex.: encoder, modulador, canal, demodulador, decodificador,
+contagem de erros) são ligados por filas limitadas: enquanto o canal processa
+o quadro k, o modulador já trabalha no quadro k+1. Filas cheias bloqueiam o
+estágio anterior (backpressure), e os buffers de entrada vêm de um
+`BufferPool` fixo, reaproveitado quando o último estágio termina o quadro.
+
+O ganho depende de os estágios liberarem o GIL (kernels grandes de NumPy);
+o relatório de utilização mostra qual estágio limita a vazão.
+"""
+import queue
+import threading
+import time
+
+import numpy as np
+
+_END = object()  # sentinela de fim de fluxo
+
+
+class BufferPool:
+    """
+    Conjunto fixo de buffers pré-alocados e reutilizáveis.
+
+    `acquire()` bloqueia enquanto todos os buffers estão em uso, limitando a
+    quantidade de quadros em voo no pipeline.
+    """
+
+    def __init__(self, count: int, shape, dtype=float):
+        if count < 1:
+            raise ValueError("O pool deve ter pelo menos um buffer.")
+        self._free = queue.Queue()
+        for _ in range(count):
+            self._free.put(np.empty(shape, dtype=dtype))
+
+    def acquire(self) -> np.ndarray:
+        return self._free.get()
+
+    def release(self, buffer: np.ndarray) -> None:
+        self._free.put(buffer)
+
+
+class PipelinedExecutor:
+    """
+    Executa uma sequência de estágios, cada um em seu próprio thread.
+
+    - stages: lista de (nome, função); cada função recebe o item do estágio
+      anterior e retorna o item do próximo.
+    - queue_size: capacidade de cada fila entre estágios.
+
+    `run(items)` retorna (saídas do último estágio na ordem de entrada, estatísticas).
+    Uma exceção em qualquer estágio é relançada em `run` após o pipeline drenar;
+    os itens descartados nesse caso são entregues a `discard` (ex.: para devolver
+    buffers ao pool).
+    """
+
+    def __init__(self, stages: list, queue_size: int = 4):
+        if not stages:
+            raise ValueError("O pipeline precisa de pelo menos um estágio.")
+        if queue_size < 1:
+            raise ValueError("queue_size deve ser >= 1.")
+        self.stages = list(stages)
+        self.queue_size = int(queue_size)
+
+    def run(self, items, discard=None) -> tuple[list, dict]:
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        busy = [0.0] * len(self.stages)
+        counts = [0] * len(self.stages)
+        errors = []
+
+        def worker(i: int, func) -> None:
+            q_in, q_out = queues[i], queues[i + 1]
+            failed = False
+            while True:
+                item = q_in.get()
+                if item is _END:
+                    q_out.put(_END)
+                    return
+                if failed or errors:
+                    # Drena a entrada para não travar os estágios anteriores
+                    if discard is not None:
+                        discard(item)
+                    continue
+                start = time.perf_counter()
+                try:
+                    result = func(item)
+                except BaseException as exc:
+                    errors.append(exc)
+                    failed = True
+                    if discard is not None:
+                        discard(item)
+                    continue
+                busy[i] += time.perf_counter() - start
+                counts[i] += 1
+                q_out.put(result)
+
+        outputs = []
+
+        def collector() -> None:
+            while True:
+                item = queues[-1].get()
+                if item is _END:
+                    return
+                outputs.append(item)
+
+        threads = [
+            threading.Thread(target=worker, args=(i, func), name=f"stage-{name}", daemon=True)
+            for i, (name, func) in enumerate(self.stages)
+        ]
+        threads.append(threading.Thread(target=collector, name="stage-collector", daemon=True))
+
+        wall_start = time.perf_counter()
+        for t in threads:
+            t.start()
+        try:
+            for item in items:
+                if errors:
+                    # O item já foi retirado da fonte (ex.: buffer do pool) e não entra no pipeline
+                    if discard is not None:
+                        discard(item)
+                    break
+                queues[0].put(item)
+        finally:
+            queues[0].put(_END)
+            for t in threads:
+                t.join()
+        wall = time.perf_counter() - wall_start
+
+        if errors:
+            raise errors[0]
+
+        stats = {
+            "wall_s": wall,
+            "stages": {
+                name: {"items": counts[i], "busy_s": busy[i]}
+                for i, (name, _) in enumerate(self.stages)
+            },
+        }
+        return outputs, stats
+
+
+def combine_stats(stats_list: list[dict]) -> dict:
+    """Soma as estatísticas de várias execuções (ex.: todos os SNRs de uma curva)."""
+    combined = {"wall_s": 0.0, "stages": {}}
+    for stats in stats_list:
+        combined["wall_s"] += stats["wall_s"]
+        for name, s in stats["stages"].items():
+            acc = combined["stages"].setdefault(name, {"items": 0, "busy_s": 0.0})
+            acc["items"] += s["items"]
+            acc["busy_s"] += s["busy_s"]
+    return combined
+
+
+def stage_utilization(stats: dict) -> dict:
+    """Fração do tempo total em que cada estágio esteve ocupado."""
+    wall = stats["wall_s"] or 1.0
+    return {name: s["busy_s"] / wall for name, s in stats["stages"].items()}
+
+
+def format_stage_report(stats: dict) -> str:
+    """Relatório textual de utilização por estágio, indicando o gargalo."""
+    utilization = stage_utilization(stats)
+    bottleneck = max(utilization, key=utilization.get)
+    lines = [f"{'Estágio':<14}{'Quadros':>9}{'Ocupado (s)':>13}{'Utilização':>12}"]
+    for name, s in stats["stages"].items():
+        mark = "  <- gargalo" if name == bottleneck else ""
+        lines.append(f"{name:<14}{s['items']:>9}{s['busy_s']:>13.3f}{utilization[name]:>11.1%}{mark}")
+    lines.append(f"Tempo total: {stats['wall_s']:.3f} s")
+    return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""
+Planejador de varreduras com prefixos compartilhados.
+
+Uma varredura é modelada como um DAG: bits -> [código] -> encoder -> modulador
+-> folhas por SNR (canal + demodulação). Cada nó interno é identificado por uma
+chave; nós com a mesma chave são criados uma única vez, calculados sob demanda
+e liberados assim que a última folha que depende deles é avaliada. Assim, as
+etapas determinísticas rodam uma vez por prefixo distinto, e não uma vez por
+ponto de SNR.
+"""
+
+
+class _Node:
+    def __init__(self, key: tuple, compute, parent: tuple | None, order: int):
+        self.key = key
+        self.compute = compute
+        self.parent = parent
+        self.order = order
+        self.pending = 0  # filhos (nós ou folhas) ainda não avaliados
+        self.value = None
+        self.ready = False
+
+
+class SweepPlan:
+    """
+    DAG de uma varredura.
+
+    - `node(key, compute, parent)`: registra um prefixo (ou reaproveita o existente);
+      `compute()` para a raiz e `compute(valor_do_pai)` para os demais.
+    - `leaf(tag, parent, evaluate)`: registra uma avaliação final, `evaluate(valor_do_pai)`.
+    - `execute()`: avalia as folhas agrupadas por prefixo e retorna {tag: resultado}.
+
+    `counts` registra quantas vezes cada estágio (key[0]) foi calculado, e
+    `peak_cached` o maior número de prefixos mantidos em memória ao mesmo tempo.
+    """
+
+    def __init__(self):
+        self._nodes = {}
+        self._leaves = []
+        self.counts = {}
+        self.peak_cached = 0
+        self._cached = 0
+
+    def node(self, key: tuple, compute, parent: tuple | None = None) -> tuple:
+        if key in self._nodes:
+            return key
+        if parent is not None and parent not in self._nodes:
+            raise KeyError(f"Nó pai não registrado: {parent}")
+        self._nodes[key] = _Node(key, compute, parent, len(self._nodes))
+        if parent is not None:
+            self._nodes[parent].pending += 1
+        return key
+
+    def leaf(self, tag, parent: tuple, evaluate) -> None:
+        if parent not in self._nodes:
+            raise KeyError(f"Nó pai não registrado: {parent}")
+        self._leaves.append((tag, parent, evaluate))
+        self._nodes[parent].pending += 1
+
+    def _path(self, key: tuple) -> tuple:
+        """Ordens de criação dos ancestrais (raiz primeiro), usadas para agrupar folhas."""
+        orders = []
+        while key is not None:
+            node = self._nodes[key]
+            orders.append(node.order)
+            key = node.parent
+        return tuple(reversed(orders))
+
+    def _value(self, key: tuple):
+        node = self._nodes[key]
+        if not node.ready:
+            if node.parent is None:
+                node.value = node.compute()
+            else:
+                node.value = node.compute(self._value(node.parent))
+            node.ready = True
+            self.counts[key[0]] = self.counts.get(key[0], 0) + 1
+            self._cached += 1
+            self.peak_cached = max(self.peak_cached, self._cached)
+        return node.value
+
+    def _release(self, key: tuple) -> None:
+        """Marca um filho de `key` como avaliado; libera o valor quando não há mais dependentes."""
+        while key is not None:
+            node = self._nodes[key]
+            node.pending -= 1
+            if node.pending > 0:
+                return
+            node.value = None
+            node.ready = False
+            self._cached -= 1
+            key = node.parent
+
+    def execute(self) -> dict:
+        # Ordenação estável pelo caminho: folhas do mesmo prefixo ficam contíguas
+        leaves = sorted(self._leaves, key=lambda leaf: self._path(leaf[1]))
+        results = {}
+        for tag, parent, evaluate in leaves:
+            results[tag] = evaluate(self._value(parent))
+            self.counts["leaf"] = self.counts.get("leaf", 0) + 1
+            self._release(parent)
+        return results
@@ -0,0 +1,156 @@
+import numpy as np
+
+
+def rrc_taps(rolloff: float, sps: int, span: int) -> np.ndarray:
+    """
+    Coeficientes do filtro Root Raised Cosine (RRC), normalizados para energia unitária.
+
+    - rolloff: fator de roll-off (0 < rolloff <= 1).
+    - sps: amostras por símbolo (fator de sobreamostragem).
+    - span: duração do filtro em símbolos (total de span*sps + 1 coeficientes).
+    """
+    if not 0.0 < rolloff <= 1.0:
+        raise ValueError("O roll-off deve estar no intervalo (0, 1].")
+    if sps < 1 or span < 1:
+        raise ValueError("sps e span devem ser inteiros >= 1.")
+
+    beta = float(rolloff)
+    # Índices inteiros de amostra centrados no meio do filtro (span*sps + 1 coeficientes);
+    # tempo em períodos de símbolo
+    t = (np.arange(span * sps + 1) - span * sps / 2) / sps
+    taps = np.empty_like(t)
+
+    # Pontos singulares: t = 0 e |t| = 1/(4*beta)
+    at_zero = np.isclose(t, 0.0)
+    at_sing = np.isclose(np.abs(t), 1.0 / (4.0 * beta))
+    regular = ~(at_zero | at_sing)
+
+    tr = t[regular]
+    num = np.sin(np.pi * tr * (1 - beta)) + 4 * beta * tr * np.cos(np.pi * tr * (1 + beta))
+    den = np.pi * tr * (1 - (4 * beta * tr) ** 2)
+    taps[regular] = num / den
+    taps[at_zero] = 1.0 - beta + 4 * beta / np.pi
+    taps[at_sing] = (beta / np.sqrt(2)) * (
+        (1 + 2 / np.pi) * np.sin(np.pi / (4 * beta)) + (1 - 2 / np.pi) * np.cos(np.pi / (4 * beta))
+    )
+
+    return taps / np.sqrt(np.sum(taps ** 2))
+
+
+class OverlapSaveFilter:
+    """
+    Filtro FIR por convolução FFT overlap-save, com estado entre blocos.
+
+    Use `process(chunk)` repetidamente para filtrar um fluxo longo pedaço a pedaço
+    (a saída tem o mesmo tamanho de cada pedaço) e `flush()` para obter a cauda de
+    len(taps) - 1 amostras. Todos os blocos de um pedaço são transformados de uma
+    vez (FFT 2-D em lote), com custo O(log L) por amostra.
+    """
+
+    def __init__(self, taps: np.ndarray, fft_size: int | None = None):
+        self.taps = np.asarray(taps)
+        L = len(self.taps)
+        if fft_size is None:
+            fft_size = max(64, 1 << int(np.ceil(np.log2(8 * L))))
+        if fft_size < L:
+            raise ValueError("fft_size deve ser >= número de coeficientes do filtro.")
+
+        self.fft_size = fft_size
+        self.step = fft_size - L + 1
+        self._real_taps = np.isrealobj(self.taps)
+        self._H = np.fft.fft(self.taps, fft_size)
+        self._H_real = np.fft.rfft(self.taps, fft_size) if self._real_taps else None
+        self.reset()
+
+    def reset(self) -> None:
+        """Zera o histórico (estado) do filtro."""
+        self._history = np.zeros(len(self.taps) - 1)
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Filtra o próximo pedaço do fluxo, retornando len(chunk) amostras."""
+        chunk = np.asarray(chunk)
+        n = len(chunk)
+        L = len(self.taps)
+        x = np.concatenate([self._history, chunk])
+        self._history = x[len(x) - (L - 1):] if L > 1 else x[:0]
+        if n == 0:
+            return x[:0]
+
+        # Quebra em blocos sobrepostos de fft_size amostras (passo = step)
+        n_blocks = -(-n // self.step)
+        total = (n_blocks - 1) * self.step + self.fft_size
+        x = np.concatenate([x, np.zeros(total - len(x), dtype=x.dtype)])
+        blocks = np.lib.stride_tricks.sliding_window_view(x, self.fft_size)[::self.step][:n_blocks]
+
+        if self._real_taps and np.isrealobj(x):
+            y = np.fft.irfft(np.fft.rfft(blocks, axis=1) * self._H_real, n=self.fft_size, axis=1)
+        else:
+            y = np.fft.ifft(np.fft.fft(blocks, axis=1) * self._H, axis=1)
+
+        # Descarta as L-1 primeiras amostras (aliasing circular) de cada bloco
+        return y[:, L - 1:].reshape(-1)[:n]
+
+    def flush(self) -> np.ndarray:
+        """Retorna a cauda do filtro (len(taps) - 1 amostras) e zera o estado."""
+        tail = self.process(np.zeros(len(self.taps) - 1))
+        self.reset()
+        return tail
+
+
+def overlap_save_convolve(x: np.ndarray, taps: np.ndarray, fft_size: int | None = None) -> np.ndarray:
+    """Convolução linear completa (como `np.convolve(x, taps)`) via overlap-save."""
+    f = OverlapSaveFilter(taps, fft_size)
+    return np.concatenate([f.process(x), f.flush()])
+
+
+class RRCPulseShaper:
+    """
+    Formatação de pulso RRC no transmissor e filtro casado + subamostragem no receptor.
+
+    Fica entre o modulador e o canal:
+        símbolos -> shape() -> canal -> matched_filter() -> símbolos -> demodulador
+
+    Os pulsos têm energia unitária e a cascata RRC*RRC é um cosseno levantado
+    (sem ISI nos instantes de amostragem), então os símbolos recuperados mantêm
+    a escala da constelação.
+    """
+
+    def __init__(self, rolloff: float = 0.35, sps: int = 8, span: int = 10,
+                 chunk_size: int | None = None, fft_size: int | None = None):
+        self.rolloff = rolloff
+        self.sps = int(sps)
+        self.span = int(span)
+        self.chunk_size = chunk_size
+        self.fft_size = fft_size
+        self.taps = rrc_taps(rolloff, self.sps, self.span)
+
+    def _filter(self, x: np.ndarray) -> np.ndarray:
+        f = OverlapSaveFilter(self.taps, self.fft_size)
+        step = self.chunk_size or max(len(x), 1)
+        pieces = [f.process(x[i:i + step]) for i in range(0, len(x), step)]
+        pieces.append(f.flush())
+        return np.concatenate(pieces)
+
+    def shape(self, symbols: np.ndarray) -> np.ndarray:
+        """Sobreamostra os símbolos (sps amostras/símbolo) e aplica o filtro RRC."""
+        symbols = np.asarray(symbols)
+        upsampled = np.zeros(len(symbols) * self.sps, dtype=symbols.dtype)
+        upsampled[::self.sps] = symbols
+        return self._filter(upsampled)
+
+    def matched_filter(self, received: np.ndarray, num_symbols: int | None = None) -> np.ndarray:
+        """Aplica o filtro casado e amostra no instante ótimo de cada símbolo."""
+        delay = len(self.taps) - 1  # atraso total das duas metades RRC
+        if num_symbols is None:
+            num_symbols = (len(received) - delay) // self.sps
+        filtered = self._filter(np.asarray(received))
+        return filtered[delay:delay + num_symbols * self.sps:self.sps]
+
+    def channel_snr_db(self, snr_db: float) -> float:
+        """
+        Converte o SNR por símbolo no SNR por amostra a aplicar no canal.
+
+        O ruído é somado às sps amostras de cada símbolo; após o filtro casado
+        a SNR por símbolo volta a ser `snr_db`.
+        """
+        return snr_db - 10.0 * np.log10(self.sps)
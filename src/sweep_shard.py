@@ -0,0 +1,325 @@
+"""
+Execução fragmentada (sharded) do benchmark BER vs SNR.
+
+Uma varredura é descrita por uma especificação JSON (mensagem, SNRs,
+combinações, semente e número de repetições). A varredura é dividida em
+unidades de trabalho (combinação, SNR, repetição), distribuídas de forma
+determinística entre N shards. Cada shard roda de forma independente, em
+qualquer máquina, e grava as contagens parciais de erros/bits em um arquivo
+de resultado autodescritivo. O comando `merge` soma os shards e produz as
+curvas finais.
+
+A semente de cada unidade é derivada apenas da semente da especificação e dos
+índices da unidade, então o resultado do merge é idêntico ao de uma execução
+em um único nó, independentemente do número de shards.
+
+Uso:
+    python src/sweep_shard.py spec --out sweep.json --message-repeat 10000 --snr-stop 30
+    python src/sweep_shard.py run sweep.json --shard 0 --num-shards 4 --out shard0.json
+    python src/sweep_shard.py merge shard*.json --out result.json [--plot]
+"""
+import argparse
+import hashlib
+import json
+import sys
+
+import numpy as np
+
+import benchmark_ber as benchmark_ber
+import data as data
+import ofdm as ofdm
+import pulse_shaping as pulse_shaping
+import utils as utils
+
+from utils import CodeID, EncoderID, ModulatorID, NoiseID
+
+SPEC_VERSION = 1
+SHARD_FORMAT = "ber-snr-shard"
+MERGED_FORMAT = "ber-snr-merged"
+
+
+def make_sweep_spec(
+    message: str,
+    snr_list_db: list[float] | np.ndarray,
+    combinations: list[tuple[EncoderID, ModulatorID]] | None = None,
+    seed: int = 0,
+    trials: int = 1,
+    shaping: dict | None = None,
+    ofdm_params: dict | None = None,
+    noise_id: NoiseID = NoiseID.AWGN,
+    channel_params: dict | None = None,
+    code_id: CodeID | None = None,
+) -> dict:
+    """Monta a especificação (serializável em JSON) de uma varredura.
+
+    - trials: número de repetições independentes (ruído distinto) por ponto.
+    - shaping: parâmetros opcionais do `RRCPulseShaper`
+      (ex.: {"rolloff": 0.35, "sps": 8, "span": 10}).
+    - ofdm_params: parâmetros opcionais do `OFDMModem`; ativam o modo OFDM
+      (ex.: {"n_fft": 64, "cp_len": 16, "pilot_spacing": 8}).
+    - noise_id: modelo de canal (AWGN, Rayleigh, Rician ou multipercurso).
+    - channel_params: parâmetros opcionais do canal, repassados a `utils.select_noise`
+      (ex.: {"k_factor": 10.0} ou {"delays": [0, 2, 5], "pdp_db": [0.0, -4.0, -8.0]}).
+    - code_id: código de canal opcional (ex.: CodeID.LDPC).
+    """
+    if combinations is None:
+        combinations = benchmark_ber.DEFAULT_COMBINATIONS
+    if trials < 1:
+        raise ValueError("O número de repetições (trials) deve ser >= 1.")
+    if channel_params:
+        # Valida os parâmetros do canal já na criação da especificação
+        try:
+            utils.select_noise(noise_id, channel_params=channel_params)
+        except TypeError as exc:
+            raise ValueError(f"Parâmetros de canal inválidos para {NoiseID(noise_id).name}: {exc}") from exc
+
+    return {
+        "version": SPEC_VERSION,
+        "message": message,
+        "snr_db": [float(s) for s in snr_list_db],
+        "combinations": [[EncoderID(e).name, ModulatorID(m).name] for e, m in combinations],
+        "noise": NoiseID(noise_id).name,
+        "channel": dict(channel_params) if channel_params else None,
+        "seed": int(seed),
+        "trials": int(trials),
+        "pulse_shaping": dict(shaping) if shaping else None,
+        "ofdm": dict(ofdm_params) if ofdm_params else None,
+        "code": CodeID(code_id).name if code_id is not None else None,
+    }
+
+
+def spec_digest(spec: dict) -> str:
+    """Hash SHA-256 da forma canônica da especificação."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def sweep_units(spec: dict) -> list[tuple[int, int, int]]:
+    """Lista ordenada de unidades (índice da combinação, índice do SNR, repetição)."""
+    return [
+        (ci, si, trial)
+        for ci in range(len(spec["combinations"]))
+        for si in range(len(spec["snr_db"]))
+        for trial in range(spec["trials"])
+    ]
+
+
+def shard_units(spec: dict, shard_index: int, num_shards: int) -> list[tuple[int, int, int]]:
+    """Unidades atribuídas ao shard `shard_index` (distribuição round-robin)."""
+    if num_shards < 1:
+        raise ValueError("O número de shards deve ser >= 1.")
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"Índice de shard inválido: {shard_index} (esperado 0..{num_shards - 1}).")
+    return sweep_units(spec)[shard_index::num_shards]
+
+
+def unit_rng(spec: dict, unit: tuple[int, int, int]) -> np.random.Generator:
+    """Gerador aleatório da unidade, derivado da semente da especificação."""
+    ci, si, trial = unit
+    return np.random.default_rng(np.random.SeedSequence([spec["seed"], ci, si, trial]))
+
+
+def run_shard(spec: dict, shard_index: int, num_shards: int) -> dict:
+    """Executa as unidades de um shard e retorna o resultado autodescritivo."""
+    data_bits = data.text_to_bits(spec["message"])
+    noise_id = NoiseID[spec["noise"]]
+    channel_params = spec.get("channel")
+    shaping = spec.get("pulse_shaping")
+    pulse_shaper = pulse_shaping.RRCPulseShaper(**shaping) if shaping else None
+    ofdm_params = spec.get("ofdm")
+    ofdm_modem = ofdm.OFDMModem(**ofdm_params) if ofdm_params else None
+    frame_len = ofdm_modem.symbol_length if ofdm_modem is not None else None
+    code = utils.select_code(CodeID[spec["code"]]) if spec.get("code") else None
+
+    # Prefixos determinísticos (código, encoder, modulador) calculados uma vez por shard
+    points = []
+    for unit in shard_units(spec, shard_index, num_shards):
+        ci, si, _ = unit
+        enc_name, mod_name = spec["combinations"][ci]
+        channel = utils.select_noise(noise_id, rng=unit_rng(spec, unit), frame_len=frame_len,
+                                     channel_params=channel_params)
+        points.append((unit, EncoderID[enc_name], ModulatorID[mod_name], channel, spec["snr_db"][si]))
+    plan = benchmark_ber.build_ber_plan(data_bits, points, pulse_shaper, ofdm_modem, code)
+
+    results = []
+    for unit, (_, errors, compared) in plan.execute().items():
+        ci, si, trial = unit
+        results.append({
+            "combination": ci,
+            "snr_index": si,
+            "trial": trial,
+            "errors": errors,
+            "compared": compared,
+        })
+
+    return {
+        "format": SHARD_FORMAT,
+        "version": SPEC_VERSION,
+        "spec": spec,
+        "spec_digest": spec_digest(spec),
+        "shard_index": shard_index,
+        "num_shards": num_shards,
+        "units": results,
+    }
+
+
+def merge_shards(shards: list[dict]) -> dict:
+    """Combina os resultados de todos os shards de uma mesma varredura.
+
+    Valida que todos os shards pertencem à mesma especificação e que
+    nenhum shard está faltando ou duplicado.
+    """
+    if not shards:
+        raise ValueError("Nenhum shard informado para o merge.")
+
+    for shard in shards:
+        if shard.get("format") != SHARD_FORMAT:
+            raise ValueError("Arquivo não é um resultado de shard válido.")
+
+    spec = shards[0]["spec"]
+    digest = spec_digest(spec)
+    num_shards = shards[0]["num_shards"]
+    for shard in shards:
+        if shard["spec_digest"] != digest or spec_digest(shard["spec"]) != digest:
+            raise ValueError("Shards de especificações diferentes não podem ser combinados.")
+        if shard["num_shards"] != num_shards:
+            raise ValueError("Shards gerados com números de shards diferentes.")
+
+    indices = sorted(shard["shard_index"] for shard in shards)
+    if indices != list(range(num_shards)):
+        raise ValueError(f"Shards incompletos ou duplicados: recebidos {indices}, esperados 0..{num_shards - 1}.")
+
+    n_comb = len(spec["combinations"])
+    n_snr = len(spec["snr_db"])
+    errors = np.zeros((n_comb, n_snr), dtype=np.int64)
+    compared = np.zeros((n_comb, n_snr), dtype=np.int64)
+    seen = set()
+    for shard in shards:
+        for unit in shard["units"]:
+            key = (unit["combination"], unit["snr_index"], unit["trial"])
+            if key in seen:
+                raise ValueError(f"Unidade duplicada entre shards: {key}.")
+            seen.add(key)
+            errors[key[0], key[1]] += unit["errors"]
+            compared[key[0], key[1]] += unit["compared"]
+
+    if len(seen) != len(sweep_units(spec)):
+        raise ValueError("Resultados de shards incompletos: faltam unidades da varredura.")
+
+    series = {}
+    for ci, (enc_name, mod_name) in enumerate(spec["combinations"]):
+        enc = utils.select_encoder(EncoderID[enc_name])
+        mod = utils.select_modulator(ModulatorID[mod_name])
+        label = benchmark_ber.combination_label(enc, mod)
+        if spec.get("code"):
+            label += f" + {spec['code']}"
+        ber = np.divide(errors[ci], compared[ci], out=np.zeros(n_snr), where=compared[ci] > 0)
+        series[label] = {
+            "errors": errors[ci].tolist(),
+            "compared": compared[ci].tolist(),
+            "ber": ber.tolist(),
+        }
+
+    return {
+        "format": MERGED_FORMAT,
+        "version": SPEC_VERSION,
+        "spec": spec,
+        "spec_digest": digest,
+        "snr_db": spec["snr_db"],
+        "series": series,
+    }
+
+
+def _load_json(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_json(obj: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=1)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark BER vs SNR fragmentado em shards.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_spec = sub.add_parser("spec", help="gera uma especificação de varredura")
+    p_spec.add_argument("--out", required=True)
+    p_spec.add_argument("--message", default="A")
+    p_spec.add_argument("--message-repeat", type=int, default=10000)
+    p_spec.add_argument("--snr-start", type=float, default=0.0)
+    p_spec.add_argument("--snr-stop", type=float, default=30.0)
+    p_spec.add_argument("--snr-step", type=float, default=1.0)
+    p_spec.add_argument("--seed", type=int, default=0)
+    p_spec.add_argument("--trials", type=int, default=1)
+    p_spec.add_argument("--noise", choices=[n.name for n in NoiseID], default=NoiseID.AWGN.name)
+    p_spec.add_argument("--rician-k", type=float, default=None, help="fator K do canal Rician")
+    p_spec.add_argument("--mp-delays", default=None,
+                        help="atrasos do multipercurso em amostras, separados por vírgula (ex.: 0,2,5)")
+    p_spec.add_argument("--mp-pdp-db", default=None,
+                        help="potência de cada percurso em dB, separada por vírgula (ex.: 0,-4,-8)")
+    p_spec.add_argument("--code", choices=[c.name for c in CodeID], default=None)
+    p_spec.add_argument("--rrc-rolloff", type=float, default=None,
+                        help="ativa a formatação de pulso RRC com este roll-off")
+    p_spec.add_argument("--rrc-sps", type=int, default=8)
+    p_spec.add_argument("--rrc-span", type=int, default=10)
+    p_spec.add_argument("--ofdm-fft", type=int, default=None,
+                        help="ativa o modo OFDM com este número de subportadoras")
+    p_spec.add_argument("--ofdm-cp", type=int, default=16)
+    p_spec.add_argument("--ofdm-pilot-spacing", type=int, default=8)
+
+    p_run = sub.add_parser("run", help="executa um shard da varredura")
+    p_run.add_argument("spec")
+    p_run.add_argument("--shard", type=int, required=True)
+    p_run.add_argument("--num-shards", type=int, required=True)
+    p_run.add_argument("--out", required=True)
+
+    p_merge = sub.add_parser("merge", help="combina os arquivos de shards")
+    p_merge.add_argument("shards", nargs="+")
+    p_merge.add_argument("--out", required=True)
+    p_merge.add_argument("--plot", action="store_true")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "spec":
+        snr_list_db = np.arange(args.snr_start, args.snr_stop + args.snr_step, args.snr_step)
+        shaping = None
+        if args.rrc_rolloff is not None:
+            shaping = {"rolloff": args.rrc_rolloff, "sps": args.rrc_sps, "span": args.rrc_span}
+        ofdm_params = None
+        if args.ofdm_fft is not None:
+            ofdm_params = {"n_fft": args.ofdm_fft, "cp_len": args.ofdm_cp, "pilot_spacing": args.ofdm_pilot_spacing}
+        channel_params = {}
+        if args.rician_k is not None:
+            channel_params["k_factor"] = args.rician_k
+        if args.mp_delays is not None:
+            channel_params["delays"] = [int(d) for d in args.mp_delays.split(",")]
+        if args.mp_pdp_db is not None:
+            channel_params["pdp_db"] = [float(p) for p in args.mp_pdp_db.split(",")]
+        spec = make_sweep_spec(args.message * args.message_repeat, snr_list_db, seed=args.seed,
+                               trials=args.trials, shaping=shaping, ofdm_params=ofdm_params,
+                               noise_id=NoiseID[args.noise], channel_params=channel_params,
+                               code_id=CodeID[args.code] if args.code else None)
+        _save_json(spec, args.out)
+        print(f"Especificação gravada em {args.out} ({len(sweep_units(spec))} unidades)")
+
+    elif args.command == "run":
+        spec = _load_json(args.spec)
+        result = run_shard(spec, args.shard, args.num_shards)
+        _save_json(result, args.out)
+        print(f"Shard {args.shard}/{args.num_shards}: {len(result['units'])} unidades gravadas em {args.out}")
+
+    elif args.command == "merge":
+        merged = merge_shards([_load_json(path) for path in args.shards])
+        _save_json(merged, args.out)
+        print(f"Resultado combinado gravado em {args.out}")
+        if args.plot:
+            series = {label: np.array(s["ber"]) for label, s in merged["series"].items()}
+            benchmark_ber.plot_ber_curves(merged["snr_db"], series, "Merge de shards")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
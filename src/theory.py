@@ -0,0 +1,146 @@
+"""
+Curvas teóricas de BER/SER sobre AWGN e verificação de consistência das simulações.
+
+A SNR segue a convenção de `noise`: SNR = Es/N0 por símbolo, com N0/2 por
+dimensão, tanto para sinais reais quanto complexos (portadora única ou OFDM).
+
+Uso interativo (verificação rápida dos mapeamentos com bits aleatórios):
+    python src/theory.py
+"""
+import numpy as np
+from scipy.special import erfc
+
+import noise as noise
+import utils as utils
+
+from utils import ModulatorID
+
+_BITS_PER_SYMBOL = {
+    ModulatorID.BPSK: 1,
+    ModulatorID.QPSK: 2,
+    ModulatorID.QAM16: 4,
+    ModulatorID.QAM64: 6,
+}
+_ORDER = {
+    ModulatorID.QPSK: 4,
+    ModulatorID.QAM16: 16,
+    ModulatorID.QAM64: 64,
+}
+
+
+def qfunc(x: np.ndarray) -> np.ndarray:
+    """Função Q gaussiana: Q(x) = 0.5 * erfc(x / sqrt(2))."""
+    return 0.5 * erfc(np.asarray(x, dtype=float) / np.sqrt(2.0))
+
+
+def _snr_linear(snr_db) -> np.ndarray:
+    return 10 ** (np.asarray(snr_db, dtype=float) / 10.0)
+
+
+def _qam_gray_ber(M: int, snr: np.ndarray) -> np.ndarray:
+    """BER exata de M-QAM quadrada com mapeamento Gray (Cho & Yoon, 2002)."""
+    sqrt_m = int(round(np.sqrt(M)))
+    bits_per_axis = int(np.log2(sqrt_m))
+    ber = np.zeros_like(snr)
+    for k in range(1, bits_per_axis + 1):
+        for i in range(int((1 - 2.0 ** -k) * sqrt_m)):
+            weight = (-1) ** np.floor(i * 2 ** (k - 1) / sqrt_m) * (
+                2 ** (k - 1) - np.floor(i * 2 ** (k - 1) / sqrt_m + 0.5)
+            )
+            ber += weight * erfc((2 * i + 1) * np.sqrt(3 * snr / (2 * (M - 1)))) / sqrt_m
+    return ber / bits_per_axis
+
+
+def ber_theory(mod_id: int | ModulatorID, snr_db) -> np.ndarray:
+    """BER teórica sobre AWGN com mapeamento Gray."""
+    mod_id = ModulatorID(mod_id)
+    snr = _snr_linear(snr_db)
+    if mod_id == ModulatorID.BPSK:
+        return qfunc(np.sqrt(2 * snr))
+    if mod_id == ModulatorID.QPSK:
+        return qfunc(np.sqrt(snr))
+    return _qam_gray_ber(_ORDER[mod_id], snr)
+
+
+def ser_theory(mod_id: int | ModulatorID, snr_db) -> np.ndarray:
+    """SER teórica sobre AWGN."""
+    mod_id = ModulatorID(mod_id)
+    snr = _snr_linear(snr_db)
+    if mod_id == ModulatorID.BPSK:
+        return qfunc(np.sqrt(2 * snr))
+    # M-QAM quadrada (QPSK = 4-QAM): erro por eixo independente
+    M = _ORDER[mod_id]
+    p_axis = 2 * (1 - 1 / np.sqrt(M)) * qfunc(np.sqrt(3 * snr / (M - 1)))
+    return 1 - (1 - p_axis) ** 2
+
+
+def wilson_interval(errors, compared, z: float = 3.0) -> tuple[np.ndarray, np.ndarray]:
+    """Intervalo de confiança de Wilson para a proporção errors/compared."""
+    errors = np.asarray(errors, dtype=float)
+    n = np.maximum(np.asarray(compared, dtype=float), 1.0)
+    p = errors / n
+    denom = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+    return center - half, center + half
+
+
+def check_consistency(mod_id: int | ModulatorID, snr_list_db, errors, compared,
+                      z: float = 3.0) -> list[dict]:
+    """
+    Compara pontos simulados com a BER teórica.
+
+    Retorna a lista de pontos em que a teoria fica fora do intervalo de confiança
+    (Wilson, `z` desvios) da simulação — sinal de mapeamento ou cadeia incorretos.
+    """
+    snr_list_db = np.asarray(snr_list_db, dtype=float)
+    errors = np.asarray(errors)
+    compared = np.asarray(compared)
+    theory = ber_theory(mod_id, snr_list_db)
+    low, high = wilson_interval(errors, compared, z)
+
+    flagged = []
+    for i in np.nonzero((compared > 0) & ((theory < low) | (theory > high)))[0]:
+        flagged.append({
+            "snr_db": float(snr_list_db[i]),
+            "simulated": float(errors[i] / compared[i]),
+            "theory": float(theory[i]),
+            "interval": (float(low[i]), float(high[i])),
+        })
+    return flagged
+
+
+def quick_mapping_check(mod_id: int | ModulatorID, snr_list_db=(0.0, 4.0, 8.0, 12.0),
+                        n_bits: int = 24000, seed: int = 0, z: float = 3.0) -> list[dict]:
+    """
+    Verificação rápida de um modulador: bits aleatórios equiprováveis, sem codificação
+    de linha, passam por modulador -> AWGN -> demodulador e são comparados com a teoria.
+
+    Retorna os pontos sinalizados por `check_consistency` (lista vazia = consistente).
+    """
+    mod_id = ModulatorID(mod_id)
+    mod = utils.select_modulator(mod_id)
+    channel = noise.AWGNNoise(rng=np.random.default_rng(seed))
+
+    n_bits -= n_bits % _BITS_PER_SYMBOL[mod_id]
+    bits = channel.rng.integers(0, 2, n_bits)
+    polar = 2.0 * bits - 1.0  # níveis ±1, interpretados como bits pelo modulador
+
+    tx_symbols = mod.modulate(polar)
+    errors, compared = [], []
+    for snr_db in snr_list_db:
+        rx_bits = mod.demodulate(channel.aplicar(tx_symbols, snr_db))
+        _, e, n = utils.compute_ber(bits, rx_bits)
+        errors.append(e)
+        compared.append(n)
+    return check_consistency(mod_id, snr_list_db, errors, compared, z)
+
+
+if __name__ == "__main__":
+    for mod_id in ModulatorID:
+        flagged = quick_mapping_check(mod_id)
+        status = "OK" if not flagged else f"{len(flagged)} ponto(s) fora do intervalo"
+        print(f"{mod_id.name:<6} {status}")
+        for point in flagged:
+            print(f"    SNR={point['snr_db']:5.1f} dB  simulado={point['simulated']:.3e}  "
+                  f"teórico={point['theory']:.3e}  IC=[{point['interval'][0]:.3e}, {point['interval'][1]:.3e}]")
@@ -1,4 +1,5 @@
 import encoder as encoder
+import ldpc as ldpc
 import modulator as modulator
 import noise as noise
 import numpy as np
@@ -14,8 +15,14 @@ class ModulatorID(IntEnum):
     QAM16 = 3
     QAM64 = 4
 
+class CodeID(IntEnum):
+    LDPC = 1
+
 class NoiseID(IntEnum):
     AWGN = 1
+    RAYLEIGH = 2
+    RICIAN = 3
+    MULTIPATH = 4
 
 def select_encoder(encoder_num: int | EncoderID) -> encoder:
     if int(encoder_num) == EncoderID.MANCHESTER:
@@ -39,11 +46,34 @@ def select_modulator(modulator_num: int | ModulatorID) -> modulator:
         raise ValueError("Número de modulador inválido. Use 1 para BPSK, 2 para QPSK, 3 para 16-QAM ou 4 para 64-QAM.")
 
 
-def select_noise(noise_num: int | NoiseID) -> noise:
+def select_noise(noise_num: int | NoiseID, rng: np.random.Generator | None = None,
+                 frame_len: int | None = None, channel_params: dict | None = None) -> noise:
+    """
+    - frame_len: tamanho do quadro de desvanecimento (ignorado no AWGN); tem
+      precedência sobre `channel_params` (ex.: alinhamento ao símbolo OFDM).
+    - channel_params: parâmetros do canal (ignorados no AWGN), ex.: {"k_factor": 10.0}
+      no Rician, {"delays": [0, 2, 5], "pdp_db": [0.0, -4.0, -8.0]} no multipercurso.
+    """
+    frame_kwargs = dict(channel_params or {})
+    if frame_len is not None:
+        frame_kwargs["frame_len"] = frame_len
     if int(noise_num) == NoiseID.AWGN:
-        return noise.AWGNNoise()
+        return noise.AWGNNoise(rng=rng)
+    elif int(noise_num) == NoiseID.RAYLEIGH:
+        return noise.RayleighFadingNoise(rng=rng, **frame_kwargs)
+    elif int(noise_num) == NoiseID.RICIAN:
+        return noise.RicianFadingNoise(rng=rng, **frame_kwargs)
+    elif int(noise_num) == NoiseID.MULTIPATH:
+        return noise.MultipathNoise(rng=rng, **frame_kwargs)
     else:
-        raise ValueError("Número de ruído inválido. Use 1 para AWGN.")
+        raise ValueError("Número de ruído inválido. Use 1 para AWGN, 2 para Rayleigh, 3 para Rician ou 4 para Multipercurso.")
+
+
+def select_code(code_num: int | CodeID) -> ldpc.LDPCCode:
+    if int(code_num) == CodeID.LDPC:
+        return ldpc.LDPCCode.from_base_matrix(ldpc.BASE_MATRIX_648_R12, ldpc.BASE_MATRIX_648_R12_Z)
+    else:
+        raise ValueError("Número de código de canal inválido. Use 1 para LDPC.")
 
 
 def reconstruct_line_levels(bits_demod: np.ndarray, encoder_name: str, original_length: int | None = None) -> np.ndarray:
@@ -86,6 +116,27 @@ def reconstruct_line_levels(bits_demod: np.ndarray, encoder_name: str, original_
         return np.where(bits_demod == 1, 1, -1).astype(int)
 
 
+def line_llrs_to_bit_llrs(llr: np.ndarray, encoder_name: str, original_length: int | None = None) -> np.ndarray:
+    """
+    Converte LLRs dos bits de modulação (níveis de linha) em LLRs dos bits de dados.
+
+    - Manchester: bit 0 -> (0, 1), bit 1 -> (1, 0); LLR = L(1ª metade) - L(2ª metade).
+    - AMI: |nível| já é o bit de dados; LLR direta.
+    """
+    llr = np.asarray(llr, dtype=float)
+    name = encoder_name.lower()
+
+    if name == "manchester":
+        n = len(llr) // 2
+        out = llr[0:2 * n:2] - llr[1:2 * n:2]
+    else:
+        out = llr
+
+    if original_length is not None:
+        out = out[:original_length]
+    return out
+
+
 def bits_for_modulation(signal: np.ndarray, modulator_name: str) -> np.ndarray:
     """
     Converte níveis de linha em bits e aplica padding.